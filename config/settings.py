@@ -1,119 +1,185 @@
 """Configuration settings for the article scraper."""
 
 import os
-from typing import Dict, List
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Tuple
+from urllib.parse import urlsplit
 from dotenv import load_dotenv
 
+
+@lru_cache(maxsize=None)
+def _load_env() -> Mapping[str, str]:
+    """Load ``.env`` once per process and snapshot the environment."""
+    load_dotenv()
+    return MappingProxyType(dict(os.environ))
+
+
 # Load environment variables
-load_dotenv()
+_ENV = _load_env()
+
+# User agent for requests - Updated to match Chrome 137 (consistent with sec-ch-ua header)
+_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36"
+)
+
+# InShorts API configuration - Prioritized for better image coverage
+_INSHORTS_CATEGORIES = MappingProxyType({
+    "top_stories": MappingProxyType({"max_limit": 15, "priority": 1}),
+    "trending": MappingProxyType({"max_limit": 12, "priority": 2}),
+    "business": MappingProxyType({"max_limit": 8, "priority": 3}),
+    "technology": MappingProxyType({"max_limit": 8, "priority": 4}),
+    "world": MappingProxyType({"max_limit": 8, "priority": 5}),
+    "sports": MappingProxyType({"max_limit": 6, "priority": 6}),
+    "entertainment": MappingProxyType({"max_limit": 6, "priority": 7}),
+    "science": MappingProxyType({"max_limit": 5, "priority": 8}),
+    "automobile": MappingProxyType({"max_limit": 4, "priority": 9}),
+    "politics": MappingProxyType({"max_limit": 6, "priority": 10}),
+})
+
+# Category names in priority order and the combined per-run article ceiling
+_INSHORTS_CATEGORY_ORDER = tuple(
+    name for name, _ in sorted(_INSHORTS_CATEGORIES.items(), key=lambda kv: kv[1]["priority"])
+)
+_INSHORTS_TOTAL_LIMIT = sum(cat["max_limit"] for cat in _INSHORTS_CATEGORIES.values())
+
+# Headers for InShorts API to avoid bot detection
+_INSHORTS_HEADERS = MappingProxyType({
+    "accept": "*/*",
+    "accept-language": "en-US,en;q=0.9",
+    "cache-control": "no-cache",
+    "content-type": "application/json",
+    "dnt": "1",
+    "pragma": "no-cache",
+    "sec-ch-ua": '"Google Chrome";v="137", "Chromium";v="137", "Not/A)Brand";v="24"',
+    "sec-ch-ua-mobile": "?0",
+    "sec-ch-ua-platform": '"Windows"',
+    "sec-fetch-dest": "empty",
+    "sec-fetch-mode": "cors",
+    "sec-fetch-site": "same-origin",
+    "user-agent": _USER_AGENT,
+})
+
+# RSS feeds configuration - Global current affairs and trending topics
+_RSS_FEEDS = MappingProxyType({
+    # Global News Sources (Working)
+    "bbc_world": "http://feeds.bbci.co.uk/news/world/rss.xml",
+    "guardian_world": "https://www.theguardian.com/world/rss",
+    "al_jazeera": "https://www.aljazeera.com/xml/rss/all.xml",
+    # Technology & Innovation (Working)
+    "techcrunch": "https://techcrunch.com/feed/",
+    "wired": "https://www.wired.com/feed/rss",
+    "the_verge": "https://www.theverge.com/rss/index.xml",
+    "ars_technica": "http://feeds.arstechnica.com/arstechnica/index",
+    # Business & Economics (Working)
+    "bloomberg": "https://feeds.bloomberg.com/markets/news.rss",
+    "financial_times": "https://www.ft.com/rss/home",
+    "forbes": "https://www.forbes.com/real-time/feed2/",
+    # Science & Health (Working)
+    "nature_news": "https://www.nature.com/nature.rss",
+    "scientific_american": "http://rss.sciam.com/ScientificAmerican-Global",
+    "new_scientist": "https://www.newscientist.com/feed/home/",
+    "who_news": "https://www.who.int/rss-feeds/news-english.xml",
+    # Culture & Society (Working)
+    "medium_trending": "https://medium.com/feed/tag/trending",
+    "medium_culture": "https://medium.com/feed/tag/culture",
+    "npr_news": "https://feeds.npr.org/1001/rss.xml",
+    # Regional Perspectives (Working)
+    "cnn_international": "http://rss.cnn.com/rss/edition.rss",
+    "dw_english": "https://rss.dw.com/rdf/rss-en-all",
+    "france24": "https://www.france24.com/en/rss",
+    "rt_news": "https://www.rt.com/rss/news/",
+    "china_daily": "http://www.chinadaily.com.cn/rss/world_rss.xml",
+    # Social & Trending (Working)
+    "reddit_worldnews": "https://www.reddit.com/r/worldnews/.rss",
+    "hackernews": "https://hnrss.org/frontpage",
+})
 
+# Medium publication feeds - Diverse topics and global perspectives (Working feeds only)
+_MEDIUM_PUBLICATIONS = (
+    "https://towardsdatascience.com/feed",
+    "https://medium.com/feed/hackernoon",
+    "https://medium.com/feed/the-startup",
+    "https://medium.com/feed/better-programming",
+    "https://medium.com/feed/better-humans",
+    "https://medium.com/feed/the-mission",
+    "https://medium.com/feed/personal-growth",
+    "https://medium.com/feed/thrive-global",
+    "https://uxdesign.cc/feed",
+    "https://medium.com/feed/swlh",
+    "https://medium.com/feed/change-becomes-you",
+    "https://medium.com/feed/global-perspectives",
+)
 
+# (name, url, host) triples so the scraper never re-parses feed URLs
+_RSS_FEED_TRIPLES = tuple(
+    (name, url, urlsplit(url).netloc) for name, url in _RSS_FEEDS.items()
+)
+_MEDIUM_PUBLICATION_TRIPLES = tuple(
+    (f"medium_pub_{i}", url, urlsplit(url).netloc)
+    for i, url in enumerate(_MEDIUM_PUBLICATIONS, 1)
+)
+
+
+@dataclass(frozen=True)
 class Config:
-    """Configuration class for the article scraper."""
+    """Configuration for the article scraper.
+
+    Values are read from the environment once, when the module is imported.
+    Use the shared ``config`` instance below instead of building new ones.
+    """
 
     # MongoDB settings
-    MONGODB_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017/")
-    MONGODB_DATABASE = os.getenv("MONGODB_DATABASE", "article_scraper")
-    MONGODB_COLLECTION = os.getenv("MONGODB_COLLECTION", "articles")
+    MONGODB_URI: str = _ENV.get("MONGODB_URI", "mongodb://localhost:27017/")
+    MONGODB_DATABASE: str = _ENV.get("MONGODB_DATABASE", "article_scraper")
+    MONGODB_COLLECTION: str = _ENV.get("MONGODB_COLLECTION", "articles")
+    # Write concern for article batches: "0", "1" or "majority"
+    MONGODB_WRITE_CONCERN: str = _ENV.get("MONGODB_WRITE_CONCERN", "1")
+    # Articles per insert batch; the server splits anything above 1000 itself
+    MONGODB_BATCH_SIZE: int = int(_ENV.get("MONGODB_BATCH_SIZE", "500"))
 
     # Scraping settings
-    TARGET_ARTICLE_COUNT = int(os.getenv("TARGET_ARTICLE_COUNT", "50"))
-    RATE_LIMIT_DELAY = float(os.getenv("RATE_LIMIT_DELAY", "2"))
-    MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))
+    TARGET_ARTICLE_COUNT: int = int(_ENV.get("TARGET_ARTICLE_COUNT", "50"))
+    RATE_LIMIT_DELAY: float = float(_ENV.get("RATE_LIMIT_DELAY", "2"))
+    MAX_RETRIES: int = int(_ENV.get("MAX_RETRIES", "3"))
+    # Sources fetched at once; per-host pacing keeps each single server polite
+    MAX_CONCURRENT_FETCHES: int = int(_ENV.get("MAX_CONCURRENT_FETCHES", "16"))
+    # ETag/Last-Modified cache for conditional RSS requests; empty disables it
+    FEED_CACHE_FILE: str = _ENV.get("FEED_CACHE_FILE", ".feed_cache.json")
+    # Development only: cache every HTTP response in this SQLite file for
+    # 10 minutes (needs requests-cache); empty disables it
+    HTTP_CACHE_FILE: str = _ENV.get("HTTP_CACHE_FILE", "")
 
     # Logging settings
-    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-    LOG_FILE = os.getenv("LOG_FILE", "logs/scraper.log")
+    LOG_LEVEL: str = _ENV.get("LOG_LEVEL", "INFO")
+    LOG_FILE: str = _ENV.get("LOG_FILE", "logs/scraper.log")
 
     # Cleanup settings
-    AUTO_CLEANUP_ENABLED = os.getenv("AUTO_CLEANUP_ENABLED", "true").lower() == "true"
-    CLEANUP_MONTHS_OLD = int(os.getenv("CLEANUP_MONTHS_OLD", "2"))
+    AUTO_CLEANUP_ENABLED: bool = _ENV.get("AUTO_CLEANUP_ENABLED", "true").lower() == "true"
+    CLEANUP_MONTHS_OLD: int = int(_ENV.get("CLEANUP_MONTHS_OLD", "2"))
+    # Expire old articles with a MongoDB TTL index instead of purging on each run
+    AUTO_CLEANUP_TTL: bool = _ENV.get("AUTO_CLEANUP_TTL", "true").lower() == "true"
+
+    USER_AGENT: str = _USER_AGENT
 
-    # User agent for requests - Updated to match Chrome 137 (consistent with sec-ch-ua header)
-    USER_AGENT = (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/137.0.0.0 Safari/537.36"
+    # InShorts API configuration
+    INSHORTS_API_BASE_URL: str = "https://inshorts.com/api/en"
+    INSHORTS_CATEGORIES: Mapping[str, Mapping[str, int]] = field(
+        default_factory=lambda: _INSHORTS_CATEGORIES
     )
+    INSHORTS_CATEGORY_ORDER: Tuple[str, ...] = _INSHORTS_CATEGORY_ORDER
+    INSHORTS_TOTAL_LIMIT: int = _INSHORTS_TOTAL_LIMIT
+    INSHORTS_HEADERS: Mapping[str, str] = field(default_factory=lambda: _INSHORTS_HEADERS)
+
+    RSS_FEEDS: Mapping[str, str] = field(default_factory=lambda: _RSS_FEEDS)
+    RSS_FEED_TRIPLES: Tuple[Tuple[str, str, str], ...] = _RSS_FEED_TRIPLES
+
+    # Medium publication feeds
+    MEDIUM_PUBLICATIONS: Tuple[str, ...] = _MEDIUM_PUBLICATIONS
+    MEDIUM_PUBLICATION_TRIPLES: Tuple[Tuple[str, str, str], ...] = _MEDIUM_PUBLICATION_TRIPLES
+
 
-    # InShorts API configuration - Prioritized for better image coverage
-    INSHORTS_API_BASE_URL = "https://inshorts.com/api/en"
-    INSHORTS_CATEGORIES = {
-        "top_stories": {"max_limit": 15, "priority": 1},
-        "trending": {"max_limit": 12, "priority": 2},
-        "business": {"max_limit": 8, "priority": 3},
-        "technology": {"max_limit": 8, "priority": 4},
-        "world": {"max_limit": 8, "priority": 5},
-        "sports": {"max_limit": 6, "priority": 6},
-        "entertainment": {"max_limit": 6, "priority": 7},
-        "science": {"max_limit": 5, "priority": 8},
-        "automobile": {"max_limit": 4, "priority": 9},
-        "politics": {"max_limit": 6, "priority": 10},
-    }
-
-    # Headers for InShorts API to avoid bot detection
-    INSHORTS_HEADERS = {
-        "accept": "*/*",
-        "accept-language": "en-US,en;q=0.9",
-        "cache-control": "no-cache",
-        "content-type": "application/json",
-        "dnt": "1",
-        "pragma": "no-cache",
-        "sec-ch-ua": '"Google Chrome";v="137", "Chromium";v="137", "Not/A)Brand";v="24"',
-        "sec-ch-ua-mobile": "?0",
-        "sec-ch-ua-platform": '"Windows"',
-        "sec-fetch-dest": "empty",
-        "sec-fetch-mode": "cors",
-        "sec-fetch-site": "same-origin",
-        "user-agent": USER_AGENT,
-    }
-
-    # RSS feeds configuration - Global current affairs and trending topics
-    RSS_FEEDS: Dict[str, str] = {
-        # Global News Sources (Working)
-        "bbc_world": "http://feeds.bbci.co.uk/news/world/rss.xml",
-        "guardian_world": "https://www.theguardian.com/world/rss",
-        "al_jazeera": "https://www.aljazeera.com/xml/rss/all.xml",
-        # Technology & Innovation (Working)
-        "techcrunch": "https://techcrunch.com/feed/",
-        "wired": "https://www.wired.com/feed/rss",
-        "the_verge": "https://www.theverge.com/rss/index.xml",
-        "ars_technica": "http://feeds.arstechnica.com/arstechnica/index",
-        # Business & Economics (Working)
-        "bloomberg": "https://feeds.bloomberg.com/markets/news.rss",
-        "financial_times": "https://www.ft.com/rss/home",
-        "forbes": "https://www.forbes.com/real-time/feed2/",
-        # Science & Health (Working)
-        "nature_news": "https://www.nature.com/nature.rss",
-        "scientific_american": "http://rss.sciam.com/ScientificAmerican-Global",
-        "new_scientist": "https://www.newscientist.com/feed/home/",
-        "who_news": "https://www.who.int/rss-feeds/news-english.xml",
-        # Culture & Society (Working)
-        "medium_trending": "https://medium.com/feed/tag/trending",
-        "medium_culture": "https://medium.com/feed/tag/culture",
-        "npr_news": "https://feeds.npr.org/1001/rss.xml",
-        # Regional Perspectives (Working)
-        "cnn_international": "http://rss.cnn.com/rss/edition.rss",
-        "dw_english": "https://rss.dw.com/rdf/rss-en-all",
-        "france24": "https://www.france24.com/en/rss",
-        "rt_news": "https://www.rt.com/rss/news/",
-        "china_daily": "http://www.chinadaily.com.cn/rss/world_rss.xml",
-        # Social & Trending (Working)
-        "reddit_worldnews": "https://www.reddit.com/r/worldnews/.rss",
-        "hackernews": "https://hnrss.org/frontpage",
-    }
-
-    # Medium publication feeds - Diverse topics and global perspectives (Working feeds only)
-    MEDIUM_PUBLICATIONS: List[str] = [
-        "https://towardsdatascience.com/feed",
-        "https://medium.com/feed/hackernoon",
-        "https://medium.com/feed/the-startup",
-        "https://medium.com/feed/better-programming",
-        "https://medium.com/feed/better-humans",
-        "https://medium.com/feed/the-mission",
-        "https://medium.com/feed/personal-growth",
-        "https://medium.com/feed/thrive-global",
-        "https://uxdesign.cc/feed",
-        "https://medium.com/feed/swlh",
-        "https://medium.com/feed/change-becomes-you",
-        "https://medium.com/feed/global-perspectives",
-    ]
+# Shared, read-only configuration instance
+config = Config()
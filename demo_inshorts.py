@@ -4,14 +4,10 @@ Demo script showing InShorts API integration.
 This demonstrates how the new InShorts functionality works.
 """
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'config'))
-
+import json
 from unittest.mock import Mock, patch
 from src.scraper import ArticleScraper
-from config.settings import Config
+from config.settings import config
 
 def demo_inshorts_integration():
     """Demonstrate InShorts API integration."""
@@ -57,13 +53,12 @@ def demo_inshorts_integration():
     }
     
     # Create scraper with real config
-    config = Config()
     scraper = ArticleScraper(config=config)
     
     # Mock the session.get method
     with patch.object(scraper.session, 'get') as mock_get:
         mock_response = Mock()
-        mock_response.json.return_value = mock_inshorts_response
+        mock_response.content = json.dumps(mock_inshorts_response).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
@@ -107,7 +102,7 @@ def demo_inshorts_integration():
         
         # Demonstrate trending topics
         mock_topics_response = Mock()
-        mock_topics_response.json.return_value = {
+        mock_topics_response.content = json.dumps({
             'data': {
                 'topics': [
                     {'name': 'Technology'},
@@ -117,7 +112,7 @@ def demo_inshorts_integration():
                     {'name': 'Artificial Intelligence'}
                 ]
             }
-        }
+        }).encode()
         mock_topics_response.raise_for_status.return_value = None
         mock_get.return_value = mock_topics_response
         
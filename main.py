@@ -4,45 +4,77 @@ Daily Article URL Scraper
 Scrapes articles from Medium and top news sites daily and stores them in MongoDB
 """
 
-import os
 import sys
+import atexit
 import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import NamedTuple
 
-# Add the src directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'config'))
+from config.settings import config
+
+
+@lru_cache(maxsize=None)
+def _ensure_log_dir(log_dir: Path) -> Path:
+    """Create the log directory once per process."""
+    log_dir.mkdir(parents=True, exist_ok=True)
+    return log_dir
 
-from src.scraper import ArticleScraper
-from src.database import DatabaseManager
-from config.settings import Config
 
 # Configure logging
-def setup_logging():
-    """Setup logging configuration."""
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
+@lru_cache(maxsize=None)
+def setup_logging() -> QueueListener:
+    """Setup logging configuration.
+
+    Log records are put on a queue by the calling thread; a background
+    listener formats them and writes to the log file and stdout. Repeated
+    calls return the already running listener.
+    """
+    _ensure_log_dir(Path(config.LOG_FILE).parent)
+    
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = RotatingFileHandler(config.LOG_FILE, maxBytes=5_000_000, backupCount=3)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # Only merge the message arguments here; the listener applies the full format
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
     
     logging.basicConfig(
-        level=getattr(logging, Config.LOG_LEVEL),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(Config.LOG_FILE),
-            logging.StreamHandler(sys.stdout)
-        ]
+        level=getattr(logging, config.LOG_LEVEL),
+        handlers=[queue_handler]
     )
+    return listener
 
 logger = logging.getLogger(__name__)
 
 
-def cleanup_old_articles():
-    """Run cleanup of old articles before scraping."""
+def cleanup_old_articles(db):
+    """Run cleanup of old articles once ``db`` is connected and indexed."""
     try:
         # Check if auto cleanup is enabled
-        if not Config.AUTO_CLEANUP_ENABLED:
+        if not config.AUTO_CLEANUP_ENABLED:
             logger.info("Auto cleanup is disabled, skipping cleanup")
             return
+        
+        # DatabaseManager.create_indexes installs a TTL index on scraped_at,
+        # so MongoDB already removes old articles in the background
+        if config.AUTO_CLEANUP_TTL:
+            if db.has_ttl_index():
+                logger.info("Old articles expire through the scraped_at TTL index, skipping purge")
+                return
+            logger.warning("scraped_at TTL index is missing, purging old articles instead")
             
         logger.info("Running cleanup of old articles...")
         
@@ -50,7 +82,7 @@ def cleanup_old_articles():
         from scripts.cleanup_articles import ArticleCleaner
         
         cleaner = ArticleCleaner()
-        result = cleaner.purge_old_articles(months_old=Config.CLEANUP_MONTHS_OLD, dry_run=False)
+        result = cleaner.purge_old_articles(months_old=config.CLEANUP_MONTHS_OLD, dry_run=False)
         
         if result["success"]:
             if result.get("deleted_count", 0) > 0:
@@ -67,32 +99,62 @@ def cleanup_old_articles():
         # Don't fail the main process if cleanup fails
 
 
-def validate_environment():
-    """Validate required environment variables."""
-    logger.info("🔍 Validating environment configuration...")
+class ValidationResult(NamedTuple):
+    """Outcome of validate_environment."""
+    
+    ok: bool
+    has_uri: bool
+
+
+@lru_cache(maxsize=1)
+def validate_environment() -> ValidationResult:
+    """Validate required environment variables.
+    
+    The configuration is frozen, so the check runs once per process.
+    """
+    logger.debug("🔍 Validating environment configuration...")
     
     # Check MongoDB configuration (without exposing sensitive data)
-    has_uri = bool(Config.MONGODB_URI and Config.MONGODB_URI.strip())
-    logger.info(f"MongoDB URI: {'✅ Configured' if has_uri else '❌ Not set'}")
-    logger.info(f"MongoDB Database: {Config.MONGODB_DATABASE}")
-    logger.info(f"MongoDB Collection: {Config.MONGODB_COLLECTION}")
-    logger.info(f"Target Article Count: {Config.TARGET_ARTICLE_COUNT}")
-    logger.info(f"Auto Cleanup Enabled: {Config.AUTO_CLEANUP_ENABLED}")
+    has_uri = bool(config.MONGODB_URI and config.MONGODB_URI.strip())
+    logger.debug(f"MongoDB URI: {'✅ Configured' if has_uri else '❌ Not set'}")
+    logger.debug(f"MongoDB Database: {config.MONGODB_DATABASE}")
+    logger.debug(f"MongoDB Collection: {config.MONGODB_COLLECTION}")
+    logger.debug(f"Target Article Count: {config.TARGET_ARTICLE_COUNT}")
+    logger.debug(f"Auto Cleanup Enabled: {config.AUTO_CLEANUP_ENABLED}")
     
     # Validate required settings
-    if not has_uri or Config.MONGODB_URI == "mongodb://localhost:27017/":
+    if not has_uri or config.MONGODB_URI == "mongodb://localhost:27017/":
         logger.warning("⚠️ MongoDB URI appears to be default/local - check if production URI is configured")
     
-    if not Config.MONGODB_DATABASE:
+    if not config.MONGODB_DATABASE:
         logger.error("❌ MongoDB database name not configured")
-        return False
+        return ValidationResult(ok=False, has_uri=has_uri)
         
-    if not Config.MONGODB_COLLECTION:
+    if not config.MONGODB_COLLECTION:
         logger.error("❌ MongoDB collection name not configured")
-        return False
+        return ValidationResult(ok=False, has_uri=has_uri)
+    
+    logger.info(
+        f"✅ Environment validated: {config.MONGODB_DATABASE}.{config.MONGODB_COLLECTION}, "
+        f"target {config.TARGET_ARTICLE_COUNT} articles, "
+        f"auto cleanup {'on' if config.AUTO_CLEANUP_ENABLED else 'off'}"
+    )
+    return ValidationResult(ok=True, has_uri=has_uri)
+
+
+def open_database(manager_cls):
+    """Connect to MongoDB, ensure indexes and clean up; runs alongside scraping."""
+    db = manager_cls()
+    if db.connect():
+        logger.info("🔗 MongoDB connection established")
+        
+        # Create indexes if they don't exist
+        logger.info("📊 Creating/updating database indexes...")
+        db.create_indexes()
     
-    logger.info("✅ Environment validation completed")
-    return True
+    # After create_indexes, so the purge fallback sees whether the TTL index exists
+    cleanup_old_articles(db)
+    return db
 
 
 def main():
@@ -102,43 +164,43 @@ def main():
     logger.info("🚀 Starting daily article scraping...")
     
     # Validate environment first
-    if not validate_environment():
+    if not validate_environment().ok:
         logger.error("❌ Environment validation failed")
         sys.exit(1)
     
     try:
-        # Run cleanup of old articles first
-        cleanup_old_articles()
+        # Heavy dependencies (feedparser, bs4, pymongo) are only loaded once scraping starts
+        from src.scraper import ArticleScraper
+        from src.database import BULK_WRITE_CONCERN, DatabaseManager
         
         # Initialize scraper
         scraper = ArticleScraper()
         
-        # Scrape articles
-        articles = scraper.scrape_daily_articles()
-        
-        if not articles:
-            logger.warning("No articles found")
-            return
-        
-        # Print articles to console
-        scraper.print_articles(articles)
-        
-        # Save to JSON file (backup)
-        json_filename = scraper.save_articles_json(articles)
+        # Connect to MongoDB, ensure indexes and clean up old articles while the
+        # feeds are being fetched; none of them depend on the scraped articles
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="db") as pool:
+            db_future = pool.submit(open_database, DatabaseManager)
+            
+            # Scrape articles
+            articles = scraper.scrape_daily_articles()
         
-        # Save to MongoDB
-        logger.info("💾 Attempting to save articles to MongoDB...")
-        with DatabaseManager() as db:
-            if db.connect():
-                logger.info("🔗 MongoDB connection established")
-                
-                # Create indexes if they don't exist
-                logger.info("📊 Creating/updating database indexes...")
-                db.create_indexes()
-                
+        # Cleanup has finished before new articles are written
+        db = db_future.result()
+        try:
+            if not articles:
+                logger.warning("No articles found")
+                return
+            
+            # Print articles to console
+            scraper.print_articles(articles)
+            
+            # Save to MongoDB
+            logger.info("💾 Attempting to save articles to MongoDB...")
+            success = False
+            if db.collection is not None:
                 # Save articles
                 logger.info(f"💾 Saving {len(articles)} articles to database...")
-                success = db.save_articles(articles)
+                success = db.save_articles(articles, consume=True)
                 
                 if success:
                     logger.info("✅ Articles successfully saved to MongoDB")
@@ -147,23 +209,30 @@ def main():
                     total_count = db.get_article_count()
                     logger.info(f"📈 Total articles in database: {total_count}")
                 else:
-                    logger.error("❌ Failed to save articles to MongoDB")
+                    logger.error("❌ Failed to save some or all articles to MongoDB")
             else:
                 logger.error("❌ Could not connect to MongoDB - check connection settings")
-                logger.error("📁 Articles saved to JSON backup only")
                 logger.error("🔧 Troubleshooting tips:")
                 logger.error("   - Verify MONGODB_URI is correct")
                 logger.error("   - Check if MongoDB server is accessible")
                 logger.error("   - Ensure network connectivity")
                 logger.error("   - Validate authentication credentials")
+            
+            # Keep a JSON backup unless MongoDB confirmed every article; with an
+            # unacknowledged write concern (w=0) failures are never reported
+            if not success or not BULK_WRITE_CONCERN.acknowledged:
+                json_filename = scraper.save_articles_json(articles)
+                logger.warning(f"📁 Articles saved to JSON backup: {json_filename}")
+        finally:
+            db.disconnect()
         
         # Print URLs for easy access
         print(f"\n{'='*60}")
         print("ARTICLE URLS:")
         print(f"{'='*60}")
         urls = scraper.get_urls_only(articles)
-        for i, url in enumerate(urls, 1):
-            print(f"{i:2d}. {url}")
+        if urls:
+            sys.stdout.write("\n".join(f"{i:2d}. {url}" for i, url in enumerate(urls, 1)) + "\n")
         
         logger.info(f"Successfully processed {len(articles)} articles")
         
@@ -4,18 +4,14 @@ Article Database Cleanup Script
 Purges articles older than specified months from MongoDB
 """
 
-import os
 import sys
 import logging
+import calendar
 from datetime import datetime, timedelta
 from typing import Optional
 
-# Add the project paths
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, project_root)
-
 from src.database import DatabaseManager
-from config.settings import Config
+from config.settings import Config, config as default_config
 
 # Configure logging
 logging.basicConfig(
@@ -29,12 +25,20 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _subtract_months(moment: datetime, months: int) -> datetime:
+    """Return ``moment`` shifted back by calendar months, clamping the day to the month's end."""
+    month_index = moment.year * 12 + moment.month - 1 - months
+    year, month = divmod(month_index, 12)
+    day = min(moment.day, calendar.monthrange(year, month + 1)[1])
+    return moment.replace(year=year, month=month + 1, day=day)
+
+
 class ArticleCleaner:
     """Handles cleanup of old articles from the database."""
     
     def __init__(self, config: Config = None):
         """Initialize the cleaner with configuration."""
-        self.config = config or Config()
+        self.config = config or default_config
         self.db_manager = DatabaseManager()
     
     def purge_old_articles(self, months_old: int = 2, dry_run: bool = False) -> dict:
@@ -50,7 +54,7 @@ class ArticleCleaner:
         """
         try:
             # Calculate cutoff date
-            cutoff_date = datetime.utcnow() - timedelta(days=months_old * 30)
+            cutoff_date = _subtract_months(datetime.utcnow(), months_old)
             logger.info(f"Purging articles older than {cutoff_date.strftime('%Y-%m-%d')}")
             
             # Connect to database
@@ -58,21 +62,21 @@ class ArticleCleaner:
                 logger.error("Failed to connect to database")
                 return {"success": False, "error": "Database connection failed"}
             
-            # Count articles to be deleted
             filter_query = {"scraped_at": {"$lt": cutoff_date}}
-            articles_count = self.db_manager.collection.count_documents(filter_query)
-            
-            if articles_count == 0:
-                logger.info("No articles found older than specified date")
-                return {
-                    "success": True,
-                    "deleted_count": 0,
-                    "message": "No old articles to delete"
-                }
-            
-            logger.info(f"Found {articles_count} articles older than {months_old} months")
             
             if dry_run:
+                # Count articles to be deleted
+                articles_count = self.db_manager.collection.count_documents(filter_query)
+                
+                if articles_count == 0:
+                    logger.info("No articles found older than specified date")
+                    return {
+                        "success": True,
+                        "deleted_count": 0,
+                        "message": "No old articles to delete"
+                    }
+                
+                logger.info(f"Found {articles_count} articles older than {months_old} months")
                 logger.info("DRY RUN: Would delete these articles")
                 
                 # Get sample of articles that would be deleted
@@ -96,10 +100,19 @@ class ArticleCleaner:
                     "sample_articles": sample_articles
                 }
             
-            # Delete old articles
-            logger.info(f"Deleting {articles_count} old articles...")
+            # Delete old articles; the delete result reports how many matched,
+            # so there is no need to count the same range first
+            logger.info(f"Deleting articles older than {months_old} months...")
             delete_result = self.db_manager.collection.delete_many(filter_query)
             
+            if delete_result.deleted_count == 0:
+                logger.info("No articles found older than specified date")
+                return {
+                    "success": True,
+                    "deleted_count": 0,
+                    "message": "No old articles to delete"
+                }
+            
             logger.info(f"Successfully deleted {delete_result.deleted_count} articles")
             
             # Get updated statistics
@@ -128,7 +141,7 @@ class ArticleCleaner:
             if not self.db_manager.connect():
                 return {"error": "Database connection failed"}
             
-            # Total count
+            # Total count, from collection metadata
             total_count = self.db_manager.get_article_count()
             
             # Count by time periods
@@ -152,8 +165,10 @@ class ArticleCleaner:
                 {"scraped_at": {"$lt": two_months_ago}}
             )
             
-            # Sources breakdown
+            # Sources breakdown over the last 30 days; matching first lets the
+            # server walk the scraped_at index instead of every document
             pipeline = [
+                {"$match": {"scraped_at": {"$gte": month_ago}}},
                 {"$group": {"_id": "$source", "count": {"$sum": 1}}},
                 {"$sort": {"count": -1}},
                 {"$limit": 10}
@@ -211,20 +226,25 @@ def main():
             logger.error(f"Error getting stats: {stats['error']}")
             sys.exit(1)
         
-        print("\n" + "="*60)
-        print("DATABASE STATISTICS")
-        print("="*60)
-        print(f"Total articles: {stats['total_articles']:,}")
-        print(f"Last week: {stats['last_week']:,}")
-        print(f"Last month: {stats['last_month']:,}")
-        print(f"Older than 2 months: {stats['older_than_2_months']:,}")
-        print(f"Database: {stats['database']}")
-        print(f"Collection: {stats['collection']}")
-        
-        print(f"\nTop sources:")
-        for source in stats['top_sources']:
-            print(f"  {source['_id']}: {source['count']:,} articles")
-        print("="*60)
+        lines = [
+            "",
+            "=" * 60,
+            "DATABASE STATISTICS",
+            "=" * 60,
+            f"Total articles: {stats['total_articles']:,}",
+            f"Last week: {stats['last_week']:,}",
+            f"Last month: {stats['last_month']:,}",
+            f"Older than 2 months: {stats['older_than_2_months']:,}",
+            f"Database: {stats['database']}",
+            f"Collection: {stats['collection']}",
+            "",
+            "Top sources (last 30 days):",
+        ]
+        lines.extend(
+            f"  {source['_id']}: {source['count']:,} articles" for source in stats['top_sources']
+        )
+        lines.append("=" * 60)
+        sys.stdout.write("\n".join(lines) + "\n")
         
     else:
         logger.info(f"Starting cleanup operation...")
@@ -78,7 +78,7 @@ check_status() {
     
     if [ -f "venv/bin/activate" ]; then
         source venv/bin/activate
-        python scripts/status_check.py
+        python -m scripts.status_check
     else
         print_error "Virtual environment not found. Run 'setup' first."
         exit 1
@@ -202,7 +202,7 @@ create_backup() {
     mkdir -p "$BACKUP_DIR"
     
     # Backup article JSON files
-    cp articles_*.json "$BACKUP_DIR/" 2>/dev/null || true
+    cp articles_*.json* "$BACKUP_DIR/" 2>/dev/null || true
     
     # Backup logs
     cp -r logs/ "$BACKUP_DIR/" 2>/dev/null || true
@@ -231,7 +231,7 @@ cleanup_articles() {
     
     if [ -f "venv/bin/activate" ]; then
         source venv/bin/activate
-        python scripts/cleanup_articles.py
+        python -m scripts.cleanup_articles
     else
         print_error "Virtual environment not found. Run 'setup' first."
         exit 1
@@ -246,7 +246,7 @@ show_stats() {
     
     if [ -f "venv/bin/activate" ]; then
         source venv/bin/activate
-        python scripts/cleanup_articles.py --stats
+        python -m scripts.cleanup_articles --stats
     else
         print_error "Virtual environment not found. Run 'setup' first."
         exit 1
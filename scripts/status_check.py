@@ -4,37 +4,47 @@ Status check script for the Daily Article Scraper
 Verifies that all components are working correctly
 """
 
-import sys
+import importlib
 import os
+import sys
+from importlib.util import find_spec
 from pathlib import Path
 
+CORE_DEPENDENCIES = ('requests', 'feedparser', 'pymongo', 'bs4')
+PROJECT_MODULES = ('src.scraper', 'src.database', 'config.settings')
+
+
+def _missing_modules(names):
+    """Return the modules that cannot be found, without executing them."""
+    missing = []
+    for name in names:
+        try:
+            if find_spec(name) is None:
+                missing.append(name)
+        except ImportError:  # parent package is missing
+            missing.append(name)
+    return missing
+
 def check_imports():
     """Check if all required modules can be imported."""
+    print("🔍 Checking imports...")
+    
+    missing = _missing_modules(CORE_DEPENDENCIES)
+    if missing:
+        print(f"❌ Import error: missing {', '.join(missing)}")
+        return False
+    print("✅ Core dependencies found")
+    
+    # Project modules are imported for real, so syntax and import errors show up
     try:
-        print("🔍 Checking imports...")
-        
-        # Add the project paths
-        project_root = Path(__file__).parent
-        sys.path.insert(0, str(project_root / 'src'))
-        sys.path.insert(0, str(project_root / 'config'))
-        
-        # Test core imports
-        import requests
-        import feedparser
-        import pymongo
-        from bs4 import BeautifulSoup
-        print("✅ Core dependencies imported successfully")
-        
-        # Test project imports
-        from src.scraper import ArticleScraper
-        from src.database import DatabaseManager
-        from config.settings import Config
-        print("✅ Project modules imported successfully")
-        
-        return True
-    except ImportError as e:
-        print(f"❌ Import error: {e}")
+        for name in PROJECT_MODULES:
+            importlib.import_module(name)
+    except Exception as e:
+        print(f"❌ Import error in {name}: {e}")
         return False
+    print("✅ Project modules imported successfully")
+    
+    return True
 
 def check_configuration():
     """Check configuration setup."""
@@ -48,9 +58,7 @@ def check_configuration():
             print("⚠️ .env file not found (using defaults)")
         
         # Test configuration loading
-        sys.path.insert(0, 'config')
-        from config.settings import Config
-        config = Config()
+        from config.settings import config
         print(f"✅ Configuration loaded - Target articles: {config.TARGET_ARTICLE_COUNT}")
         
         return True
@@ -65,8 +73,12 @@ def check_directories():
     required_dirs = ['src', 'config', 'logs', 'scripts', 'tests']
     all_exist = True
     
+    # One directory listing instead of a stat() per required directory
+    with os.scandir('.') as entries:
+        present = {entry.name for entry in entries if entry.is_dir()}
+    
     for directory in required_dirs:
-        if Path(directory).exists():
+        if directory in present:
             print(f"✅ {directory}/ directory exists")
         else:
             print(f"❌ {directory}/ directory missing")
@@ -79,9 +91,6 @@ def test_scraper():
     try:
         print("🔍 Testing scraper...")
         
-        sys.path.insert(0, 'src')
-        sys.path.insert(0, 'config')
-        
         from src.scraper import ArticleScraper
         scraper = ArticleScraper()
         
@@ -1,53 +1,137 @@
 """Database operations for MongoDB."""
 
-import hashlib
+import atexit
 import logging
 import traceback
+from importlib.util import find_spec
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-from pymongo import MongoClient
-from pymongo.errors import ConnectionFailure, OperationFailure
-from config.settings import Config
+from threading import Lock
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+from pymongo import ASCENDING, IndexModel, MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError, ConnectionFailure, OperationFailure
+from pymongo.write_concern import WriteConcern
+from config.settings import config
 
 logger = logging.getLogger(__name__)
 
+# Server error codes for unique index violations and index option changes
+DUPLICATE_KEY_ERROR = 11000
+INDEX_OPTIONS_CONFLICT_ERROR = 85
+
+# Wire compressors in order of preference; zstd and snappy need optional packages
+COMPRESSORS = ",".join(
+    [name for name, module in (("zstd", "zstandard"), ("snappy", "snappy")) if find_spec(module)]
+    + ["zlib"]
+)
+
+# Fields returned by get_recent_articles unless the caller asks for more
+RECENT_ARTICLE_FIELDS = MappingProxyType(
+    {'title': 1, 'url': 1, 'source': 1, 'published': 1, 'scraped_at': 1}
+)
+
+# Tags article batches so they can be traced in db.currentOp() and the profiler
+SAVE_COMMENT = "daily-scraper-save"
+# Reported in the server logs, currentOp and the profiler for this client's operations
+APP_NAME = "daily-article-scrapper"
+
+
+def _write_concern(w: str) -> WriteConcern:
+    """Build the write concern for article batches from ``MONGODB_WRITE_CONCERN``.
+    
+    ``1`` (the default) waits for the primary only and ``majority`` for
+    replication. ``0`` is fire-and-forget: the server never reports errors,
+    so duplicate or failed writes go unnoticed; keep it for backfills.
+    """
+    value = int(w) if w.isdigit() else w
+    if value in (0, 1):
+        return WriteConcern(w=value, j=False)
+    return WriteConcern(w=value)
+
+
+# Acknowledgement required for article batches
+BULK_WRITE_CONCERN = _write_concern(config.MONGODB_WRITE_CONCERN)
+
+
+def _chunks(seq: Sequence[Any], n: int) -> Iterator[Sequence[Any]]:
+    """Yield consecutive slices of ``seq`` holding at most ``n`` items."""
+    for start in range(0, len(seq), n):
+        yield seq[start:start + n]
+
 
 class DatabaseManager:
     """Manages MongoDB operations for article storage."""
     
+    # Namespaces ("db.collection") whose indexes were already ensured by this process
+    _INDEXES_BUILT: Set[str] = set()
+    
+    # One pooled client per URI, shared by every manager in the process
+    _CLIENTS: Dict[str, MongoClient] = {}
+    _CLIENTS_LOCK = Lock()
+    
     def __init__(self, uri: str = None, database: str = None, collection: str = None):
         """Initialize database connection."""
-        self.uri = uri or Config.MONGODB_URI
-        self.database_name = database or Config.MONGODB_DATABASE
-        self.collection_name = collection or Config.MONGODB_COLLECTION
+        self.uri = uri or config.MONGODB_URI
+        self.database_name = database or config.MONGODB_DATABASE
+        self.collection_name = collection or config.MONGODB_COLLECTION
         self.client: Optional[MongoClient] = None
         self.database = None
         self.collection = None
         
+    @classmethod
+    def _get_client(cls, uri: str) -> MongoClient:
+        """Return the process-wide client for ``uri``, creating it on first use.
+        
+        MongoClient is thread-safe and pools its connections, so every
+        manager in the process shares one instead of repeating the handshake.
+        """
+        with cls._CLIENTS_LOCK:
+            client = cls._CLIENTS.get(uri)
+            if client is None:
+                client = MongoClient(
+                    uri, 
+                    maxPoolSize=50,
+                    appname=APP_NAME,
+                    compressors=COMPRESSORS,
+                    zlibCompressionLevel=3,
+                    serverSelectionTimeoutMS=10000,  # Increased timeout
+                    connectTimeoutMS=10000,
+                    socketTimeoutMS=10000
+                )
+                
+                # Test the connection
+                logger.debug("Testing MongoDB connection...")
+                try:
+                    client.admin.command('ismaster')
+                except Exception:
+                    client.close()
+                    raise
+                
+                if not cls._CLIENTS:
+                    atexit.register(cls.close_clients)
+                cls._CLIENTS[uri] = client
+            return client
+    
+    @classmethod
+    def close_clients(cls):
+        """Close every shared client; registered to run at interpreter exit."""
+        with cls._CLIENTS_LOCK:
+            for client in cls._CLIENTS.values():
+                client.close()
+            cls._CLIENTS.clear()
+    
     def connect(self) -> bool:
         """Establish connection to MongoDB."""
         try:
-            logger.info("🔌 Attempting to connect to MongoDB...")
-            logger.info(f"Database: {self.database_name}, Collection: {self.collection_name}")
-            
-            self.client = MongoClient(
-                self.uri, 
-                serverSelectionTimeoutMS=10000,  # Increased timeout
-                connectTimeoutMS=10000,
-                socketTimeoutMS=10000
-            )
+            logger.debug("🔌 Attempting to connect to MongoDB...")
+            logger.debug("Database: %s, Collection: %s", self.database_name, self.collection_name)
             
-            # Test the connection
-            logger.info("Testing MongoDB connection...")
-            self.client.admin.command('ismaster')
+            self.client = self._get_client(self.uri)
             
+            # ismaster already proved the client can reach the server when it was created
             self.database = self.client[self.database_name]
             self.collection = self.database[self.collection_name]
             
-            # Verify collection access
-            logger.info("Verifying collection access...")
-            self.collection.count_documents({})
-            
             logger.info(f"✅ Successfully connected to MongoDB: {self.database_name}.{self.collection_name}")
             return True
             
@@ -61,19 +145,33 @@ class DatabaseManager:
             return False
     
     def disconnect(self):
-        """Close MongoDB connection."""
+        """Release this manager's handle; the shared client stays open for reuse."""
         if self.client:
-            self.client.close()
+            self.client = None
+            self.database = None
+            self.collection = None
             logger.info("Disconnected from MongoDB")
     
-    def _serialize_datetime_fields(self, article: Dict[str, Any]) -> None:
-        """Serialize datetime objects to ISO format strings for MongoDB."""
-        for key, value in article.items():
-            if isinstance(value, datetime):
-                article[key] = value.isoformat()
-    
-    def save_articles(self, articles: List[Dict[str, Any]]) -> bool:
-        """Save articles to MongoDB."""
+    def save_articles(
+        self,
+        articles: List[Dict[str, Any]],
+        update_existing: bool = False,
+        *,
+        consume: bool = False,
+    ) -> bool:
+        """Save articles to MongoDB.
+        
+        Articles are inserted in unordered batches of MONGODB_BATCH_SIZE; ones
+        already stored are left alone. Pass ``update_existing=True`` to refresh
+        the stored copies of those duplicates with the newly scraped fields.
+        
+        Each article is copied before it is stamped. Callers that hand over
+        the list can pass ``consume=True`` to have the dicts updated in place
+        instead (scraped_at is added and published normalized).
+        
+        Returns True only when every valid article was stored (duplicates
+        count as stored), so callers know when to keep a backup.
+        """
         if self.collection is None:
             logger.error("❌ No database connection available")
             return False
@@ -81,41 +179,40 @@ class DatabaseManager:
         try:
             logger.info(f"📝 Preparing to save {len(articles)} articles to MongoDB...")
             
+            # One timestamp for the whole batch
+            scraped_at = datetime.utcnow()
+            scraped_at_iso = scraped_at.isoformat()
+            
             # Process articles one by one for better error tracking
             processed_articles = []
             for i, article in enumerate(articles):
                 try:
-                    # Make a copy to avoid modifying original
-                    processed_article = dict(article)
-                    
-                    # Add metadata
-                    scraped_at = datetime.utcnow()
-                    processed_article['scraped_at'] = scraped_at
+                    # scraped_at is a BSON date, which the range queries in cleanup and
+                    # get_recent_articles rely on
+                    if consume:
+                        processed_article = article
+                        processed_article['scraped_at'] = scraped_at
+                    else:
+                        processed_article = {**article, 'scraped_at': scraped_at}
                     
-                    # Create safe ID
-                    url = str(processed_article.get('url', ''))
-                    if not url:
-                        logger.warning(f"Article {i} has no URL, skipping")
+                    # The unique url index is the dedup key; MongoDB assigns the _id.
+                    # Scrapers always emit url as str, so it is checked as is
+                    if not processed_article.get('url'):
+                        logger.warning("Article %d has no URL, skipping", i)
                         continue
                     
-                    url_hash = hashlib.md5(url.encode('utf-8')).hexdigest()[:16]
-                    date_str = scraped_at.strftime('%Y%m%d')
-                    processed_article['_id'] = f"{url_hash}_{date_str}"
-                    
-                    # Clean up data types
-                    if 'tags' in processed_article and not isinstance(processed_article['tags'], list):
-                        processed_article['tags'] = []
-                    
-                    if 'published' in processed_article and not processed_article['published']:
-                        processed_article['published'] = scraped_at.isoformat()
-                    
-                    # Ensure all datetime objects are serialized for MongoDB
-                    self._serialize_datetime_fields(processed_article)
+                    # published is the only scraped field that may be a datetime; keep it
+                    # ISO text like the rest so the published index sorts one type
+                    published = processed_article.get('published')
+                    if isinstance(published, datetime):
+                        processed_article['published'] = published.isoformat()
+                    elif 'published' in processed_article and not published:
+                        processed_article['published'] = scraped_at_iso
                     
                     processed_articles.append(processed_article)
                     
                 except Exception as e:
-                    logger.error(f"Error processing article {i}: {type(e).__name__} - {str(e)}")
+                    logger.error("Error processing article %d: %s - %s", i, type(e).__name__, e)
                     continue
             
             logger.info(f"Successfully processed {len(processed_articles)} articles")
@@ -124,59 +221,127 @@ class DatabaseManager:
                 logger.warning("⚠️ No valid articles to save")
                 return False
             
-            # Save articles one by one with graceful error handling
             success_count = 0
             error_count = 0
-            
-            for i, article in enumerate(processed_articles):
-                try:
-                    # Try to insert the article first
-                    self.collection.insert_one(article)
-                    success_count += 1
-                    logger.debug(f"✅ Successfully inserted article {i+1}/{len(processed_articles)}")
-                    
-                except Exception as insert_error:
-                    # If insert fails (likely duplicate), try upsert without _id field
-                    try:
-                        # Create a copy without the _id field for upsert
-                        article_for_update = {k: v for k, v in article.items() if k != '_id'}
-                        
-                        result = self.collection.replace_one(
-                            {'url': article['url']},
-                            article_for_update,
-                            upsert=True
-                        )
-                        if result.upserted_id:
-                            success_count += 1
-                            logger.debug(f"✅ Upserted article {i+1}/{len(processed_articles)} (new)")
-                        elif result.modified_count > 0:
-                            success_count += 1
-                            logger.debug(f"✅ Updated article {i+1}/{len(processed_articles)} (existing)")
-                        else:
-                            logger.debug(f"ℹ️ Article {i+1}/{len(processed_articles)} unchanged")
-                            success_count += 1  # Count as success since it exists
-                            
-                    except Exception as upsert_error:
-                        error_count += 1
-                        logger.warning(
-                            f"⚠️ Failed to save article {i+1}/{len(processed_articles)}: "
-                            f"{type(upsert_error).__name__} - {str(upsert_error)}"
-                        )
-                        logger.debug(f"Article URL: {article.get('url', 'N/A')}")
-                        continue
+            for batch in _chunks(processed_articles, config.MONGODB_BATCH_SIZE):
+                saved, failed = self._insert_articles(batch, update_existing)
+                success_count += saved
+                error_count += failed
             
             logger.info(f"✅ Database operations completed: {success_count} successful, {error_count} failed")
             
-            # Return True if we saved at least some articles
-            return success_count > 0
+            # Any failed article means the batch did not fully reach MongoDB
+            return success_count > 0 and error_count == 0
                 
         except Exception as e:
             logger.error(f"❌ Unexpected error saving articles: {type(e).__name__} - {str(e)}")
             logger.error(f"Traceback: {traceback.format_exc()}")
             return False
     
-    def get_recent_articles(self, days: int = 7, limit: int = 100) -> List[Dict[str, Any]]:
-        """Retrieve recent articles from the database."""
+    def _bulk_collection(self):
+        """Collection handle for the article batches.
+        
+        Batches use the configurable MONGODB_WRITE_CONCERN (primary-only by
+        default); other writes keep the client default. main.py keeps a JSON
+        backup whenever a save reports failures or the writes are unacknowledged.
+        """
+        return self.collection.with_options(write_concern=BULK_WRITE_CONCERN)
+    
+    @staticmethod
+    def _bulk_write_options() -> Dict[str, Any]:
+        """Keyword arguments shared by the article batch writes.
+        
+        Document validation is bypassed for speed, except with w=0: pymongo
+        refuses that option on unacknowledged writes.
+        """
+        return {
+            'ordered': False,
+            'bypass_document_validation': BULK_WRITE_CONCERN.acknowledged,
+            'comment': SAVE_COMMENT,
+        }
+    
+    def _insert_articles(
+        self, articles: List[Dict[str, Any]], update_existing: bool = False
+    ) -> Tuple[int, int]:
+        """Insert articles in one unordered batch.
+        
+        Articles already stored are skipped, or upserted on their own when
+        ``update_existing`` is set, so the rest of the batch is never rewritten.
+        """
+        try:
+            result = self._bulk_collection().insert_many(articles, **self._bulk_write_options())
+            return len(result.inserted_ids), 0
+        except BulkWriteError as bwe:
+            saved, failed = self._count_bulk_write_error(bwe, articles, 'nInserted')
+            if not update_existing:
+                return saved, failed
+            
+            duplicates = [
+                articles[error['index']]
+                for error in bwe.details.get('writeErrors', [])
+                if error.get('code') == DUPLICATE_KEY_ERROR
+            ]
+            if not duplicates:
+                return saved, failed
+            refreshed, refresh_failed = self._upsert_articles(duplicates)
+            return saved - len(duplicates) + refreshed, failed + refresh_failed
+    
+    def _upsert_articles(self, articles: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """Upsert articles by URL in one unordered batch."""
+        operations = [
+            UpdateOne(
+                {'url': article['url']},
+                {'$set': {k: v for k, v in article.items() if k != '_id'}},
+                upsert=True,
+            )
+            for article in articles
+        ]
+        try:
+            result = self._bulk_collection().bulk_write(operations, **self._bulk_write_options())
+            if not result.acknowledged:
+                # w=0: the server reports nothing back, so assume every write landed
+                return len(operations), 0
+            return result.upserted_count + result.matched_count, 0
+        except BulkWriteError as bwe:
+            return self._count_bulk_write_error(bwe, articles, 'nUpserted', 'nMatched')
+    
+    def _count_bulk_write_error(
+        self, bwe: BulkWriteError, articles: List[Dict[str, Any]], *applied_keys: str
+    ) -> Tuple[int, int]:
+        """Return (saved, failed) counts for a partially applied unordered batch.
+        
+        Duplicate keys mean the article is already stored, so they count as saved.
+        """
+        details = bwe.details
+        write_errors = details.get('writeErrors', [])
+        failures = [e for e in write_errors if e.get('code') != DUPLICATE_KEY_ERROR]
+        success_count = (
+            sum(details.get(key, 0) for key in applied_keys)
+            + len(write_errors) - len(failures)
+        )
+        total = len(articles)
+        log_urls = logger.isEnabledFor(logging.DEBUG)
+        for error in failures:
+            index = error.get('index', 0)
+            logger.warning(
+                "⚠️ Failed to save article %d/%d: code %s - %s",
+                index + 1, total, error.get('code'), error.get('errmsg', ''),
+            )
+            if log_urls:
+                logger.debug("Article URL: %s", articles[index].get('url', 'N/A'))
+        return success_count, len(failures)
+    
+    def get_recent_articles(
+        self,
+        days: int = 7,
+        limit: int = 100,
+        projection: Optional[Dict[str, Any]] = RECENT_ARTICLE_FIELDS,
+    ) -> List[Dict[str, Any]]:
+        """Retrieve recent articles from the database.
+        
+        Only the listing fields are fetched by default; pass ``projection=None``
+        for whole documents, including summaries.
+        """
         if self.collection is None:
             logger.error("No database connection available")
             return []
@@ -184,8 +349,8 @@ class DatabaseManager:
         try:
             cutoff_date = datetime.utcnow() - timedelta(days=days)
             cursor = self.collection.find(
-                {'scraped_at': {'$gte': cutoff_date}}
-            ).sort('scraped_at', -1).limit(limit)
+                {'scraped_at': {'$gte': cutoff_date}}, projection
+            ).sort('scraped_at', -1).limit(limit).batch_size(limit)
             
             articles = list(cursor)
             logger.info(f"Retrieved {len(articles)} recent articles")
@@ -195,31 +360,96 @@ class DatabaseManager:
             logger.error(f"Error retrieving articles: {e}")
             return []
     
-    def get_article_count(self) -> int:
-        """Get total count of articles in the database."""
+    def get_article_count(self, exact: bool = False) -> int:
+        """Get total count of articles in the database.
+        
+        The count comes from collection metadata, which is O(1) but may be
+        slightly off after an unclean shutdown. Pass ``exact=True`` to count
+        the documents instead.
+        """
         if self.collection is None:
             return 0
         
         try:
-            count = self.collection.count_documents({})
-            return count
+            if exact:
+                return self.collection.count_documents({})
+            return self.collection.estimated_document_count()
         except Exception as e:
             logger.error(f"Error counting articles: {e}")
             return 0
     
+    def has_ttl_index(self) -> bool:
+        """Return whether MongoDB expires old articles through a TTL on scraped_at.
+        
+        create_indexes only logs its failures (collMod, for one, needs more
+        than readWrite), so callers check the index itself before relying on it.
+        """
+        if self.collection is None:
+            return False
+        
+        try:
+            indexes = self.collection.index_information().values()
+        except Exception as e:
+            logger.error(f"Error reading indexes: {e}")
+            return False
+        return any(
+            index['key'][0][0] == 'scraped_at' and 'expireAfterSeconds' in index
+            for index in indexes
+        )
+    
     def create_indexes(self):
         """Create database indexes for better performance."""
         if self.collection is None:
             logger.error("No database connection available")
             return
         
+        namespace = self.collection.full_name
+        if namespace in DatabaseManager._INDEXES_BUILT:
+            logger.debug(f"Indexes already ensured for {namespace}, skipping")
+            return
+        
+        # TTL is expressed in seconds, so a month is approximated as 30 days
+        use_ttl = config.AUTO_CLEANUP_ENABLED and config.AUTO_CLEANUP_TTL
+        expire_after = config.CLEANUP_MONTHS_OLD * 30 * 24 * 60 * 60
+        scraped_at_options = {"expireAfterSeconds": expire_after} if use_ttl else {}
+        
+        # Make URL index unique but handle duplicates gracefully. With the TTL
+        # index on scraped_at the server removes expired articles in the background.
+        scraped_at_index = IndexModel([("scraped_at", ASCENDING)], **scraped_at_options)
+        indexes = [
+            IndexModel([("url", ASCENDING)], unique=True),
+            scraped_at_index,
+            IndexModel([("source", ASCENDING)]),
+            IndexModel([("published", ASCENDING)]),
+        ]
+        
         try:
-            # Create indexes - make URL index unique but handle duplicates gracefully
-            self.collection.create_index("url", unique=True, background=True)
-            self.collection.create_index("scraped_at", background=True)
-            self.collection.create_index("source", background=True)
-            self.collection.create_index("published", background=True)
+            try:
+                # One createIndexes command for all of them
+                self.collection.create_indexes(indexes)
+            except OperationFailure as e:
+                if e.code != INDEX_OPTIONS_CONFLICT_ERROR:
+                    raise
+                if use_ttl:
+                    # An existing plain scraped_at index is converted in place
+                    self.database.command(
+                        "collMod", self.collection_name,
+                        index={"keyPattern": {"scraped_at": 1}, "expireAfterSeconds": expire_after},
+                    )
+                else:
+                    # TTL cleanup was switched off. collMod cannot unset
+                    # expireAfterSeconds, so the TTL index is dropped and rebuilt plain
+                    index_name = scraped_at_index.document["name"]
+                    existing = self.collection.index_information().get(index_name, {})
+                    if "expireAfterSeconds" not in existing:
+                        raise
+                    self.collection.drop_index(index_name)
+                    logger.info("Removed the scraped_at TTL; articles no longer expire automatically")
+                self.collection.create_indexes(indexes)
+            DatabaseManager._INDEXES_BUILT.add(namespace)
             logger.info("Database indexes created successfully")
+            if use_ttl:
+                logger.info(f"Articles expire {config.CLEANUP_MONTHS_OLD * 30} days after scraping")
         except Exception as e:
             logger.error(f"Error creating indexes: {type(e).__name__}")
             # Don't fail if indexes already exist or have conflicts
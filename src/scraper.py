@@ -2,30 +2,230 @@
 
 import feedparser
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+import gzip
+import html
 import json
+import re
+import sys
 from datetime import datetime, timezone
 import time
-import random
-from urllib.parse import urlparse
+from pathlib import Path
+from urllib.parse import urlparse, urlsplit
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, TypedDict
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
-from config.settings import Config
+from importlib.util import find_spec
+from threading import BoundedSemaphore, Lock
+from config.settings import Config, config as default_config
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the standard library
+    orjson = None
+
+try:
+    from requests_cache import CachedSession
+except ImportError:  # Development-only dependency, see HTTP_CACHE_FILE
+    CachedSession = None
+
+# lxml's C parser is much faster on large pages; html.parser is the stdlib fallback
+_HTML_PARSER = "lxml" if find_spec("lxml") else "html.parser"
 
 logger = logging.getLogger(__name__)
 
 
+class Article(TypedDict, total=False):
+    """Shape of a scraped article record.
+
+    Articles stay plain dicts so they can be handed to MongoDB, the JSON
+    backup and callers without conversion.
+    """
+
+    title: str
+    url: str
+    published: str
+    summary: str
+    source: str
+    tags: List[str]
+    image: str
+    # InShorts-only fields
+    inshorts_id: str
+    original_source: str
+
+
+# Custom RSS image fields (common extensions), checked in order
+_IMAGE_FIELDS = ("image", "featured_image", "thumbnail", "img", "picture")
+
+# _is_valid_image_url filters, as tuples for single str.startswith/endswith calls
+_IMAGE_URL_PREFIXES = ("http://", "https://", "//")
+_NON_IMAGE_EXTENSIONS = (".pdf", ".doc", ".docx", ".zip", ".mp4", ".avi", ".mp3")
+_LOCAL_HOSTS = ("localhost", "127.0.0.1")
+
+# First <img> tag in a snippet and its src attribute (not data-src)
+_IMG_TAG_RE = re.compile(r"<img\b[^>]*>", re.IGNORECASE)
+_IMG_SRC_RE = re.compile(r"""\ssrc\s*=\s*["']([^"']+)["']""", re.IGNORECASE)
+
+# Only these tags are built into the tree when a page is scanned for one of them
+_IMG_STRAINER = SoupStrainer("img")
+_META_STRAINER = SoupStrainer("meta")
+
+# URL inside a CSS background-image: url(...) declaration
+_BG_IMAGE_RE = re.compile(r"""url\(["']?(.*?)["']?\)""")
+
+# Statuses worth retrying with backoff (Retry-After is honoured for 429/503)
+_RETRY_STATUSES = (429, 502, 503, 504)
+
+# Longest Retry-After wait honoured before a retry, in seconds
+_RETRY_AFTER_MAX = 10.0
+
+# Minimum spacing between feed requests to the same host, in seconds
+_HOST_REQUEST_INTERVAL = 1.0
+
+# Bytes of an article page read by _fetch_page_image; the meta tags it looks
+# for sit in the <head>, well inside the first few KB of news pages
+_PAGE_HEAD_BYTES = 64 * 1024
+
+# Concurrent article page lookups in _enhance_articles_with_images
+_IMAGE_LOOKUP_WORKERS = 8
+
+# Article pages downloaded from the same host at once by _fetch_page_image
+_PAGE_FETCHES_PER_HOST = 2
+
+# Concurrent InShorts category requests; starts are paced by RATE_LIMIT_DELAY
+_INSHORTS_WORKERS = 4
+
+# Medium article links: /p/<id> short links and /@author/<slug> posts
+_MEDIUM_ARTICLE_HREF_RE = re.compile(r"/p/|/@")
+
+
+def _dedup_key(url: str) -> str:
+    """Normalize ``url`` for duplicate detection.
+
+    The scheme, host case, fragment, a trailing slash and utm_* tracking
+    parameters do not change which article a link points to.
+    """
+    parts = urlsplit(url)
+    query = "&".join(
+        param for param in parts.query.split("&") if param and not param.startswith("utm_")
+    )
+    return f"{parts.netloc.lower()}{parts.path.rstrip('/')}?{query}"
+
+
+def _published_iso(entry) -> str:
+    """Return a feed entry's publication time as ISO 8601 text.
+
+    feedparser has already parsed RSS and Atom dates into a UTC struct_time.
+    Converting that once here means _sort_articles can order RSS articles
+    next to the ISO timestamps of the other sources. Dates feedparser could
+    not parse are kept as published.
+    """
+    parsed = getattr(entry, "published_parsed", None)
+    if isinstance(parsed, time.struct_time):
+        return datetime(*parsed[:6], tzinfo=timezone.utc).isoformat()
+    return getattr(entry, 'published', entry.get("published", "") if hasattr(entry, 'get') else "")
+
+
+def _loads(payload: bytes) -> Any:
+    """Decode a JSON payload, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+def _dumps(obj: Any) -> bytes:
+    """Encode ``obj`` as indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str)
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=str).encode("utf-8")
+
+
+class _CappedRetry(Retry):
+    """Retry that honours Retry-After for at most ``_RETRY_AFTER_MAX`` seconds.
+
+    Left alone, urllib3 sleeps for whatever the server asks (up to six hours),
+    which the request timeout does not bound.
+    """
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, _RETRY_AFTER_MAX)
+
+
+def build_session(config: Config = None) -> requests.Session:
+    """Build a pooled HTTP session with connection-level retries."""
+    config = config or default_config
+    if config.HTTP_CACHE_FILE and CachedSession is not None:
+        # Repeated development runs replay responses instead of re-fetching
+        session = CachedSession(config.HTTP_CACHE_FILE, backend="sqlite", expire_after=600)
+    else:
+        if config.HTTP_CACHE_FILE:
+            logger.warning("HTTP_CACHE_FILE is set but requests-cache is not installed")
+        session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        # Also retry transient gateway/overload answers; once retries run out the
+        # last response is returned so raise_for_status reports it as usual
+        max_retries=_CappedRetry(
+            total=config.MAX_RETRIES,
+            backoff_factor=0.5,
+            status_forcelist=_RETRY_STATUSES,
+            raise_on_status=False,
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"User-Agent": config.USER_AGENT})
+    return session
+
+
 class ArticleScraper:
     """Main article scraper class."""
 
-    def __init__(self, config: Config = None):
-        """Initialize the scraper with configuration."""
-        self.config = config or Config()
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": self.config.USER_AGENT})
-        self.articles_lock = Lock()  # For thread-safe operations
+    def __init__(self, config: Config = None, session: requests.Session = None):
+        """Initialize the scraper with configuration and an optional shared session."""
+        self.config = config or default_config
+        self.session = session or build_session(self.config)
+        # Normalized once so each InShorts request merges a ready-made header map
+        self.inshorts_headers = CaseInsensitiveDict(self.config.INSHORTS_HEADERS)
+        # Earliest time.monotonic() at which each host may be requested again
+        self._host_next_request: Dict[str, float] = {}
+        self._host_lock = Lock()
+        # Page URL -> image found on it ("" when none), filled by _extract_image_from_webpage
+        self._page_image_cache: Dict[str, str] = {}
+        # Host -> slots for concurrent page downloads, guarded by _host_lock
+        self._page_fetch_slots: Dict[str, BoundedSemaphore] = {}
+        # Per feed URL: the ETag/Last-Modified validators and the articles they cover
+        self.feed_cache: Dict[str, Dict[str, Any]] = self._load_feed_cache()
+
+    def _load_feed_cache(self) -> Dict[str, Dict[str, Any]]:
+        """Load the conditional-request cache written by the previous run."""
+        path = self.config.FEED_CACHE_FILE
+        if not path:
+            return {}
+        try:
+            return _loads(Path(path).read_bytes())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable feed cache {path}: {e}")
+            return {}
+
+    def save_feed_cache(self):
+        """Persist feed validators so the next run can send conditional requests."""
+        path = self.config.FEED_CACHE_FILE
+        if not path:
+            return
+        try:
+            Path(path).write_bytes(_dumps(self.feed_cache))
+        except OSError as e:
+            logger.warning(f"Could not write feed cache {path}: {e}")
 
     def _extract_image_from_rss_entry(self, entry) -> str:
         """Extract image URL from RSS entry with enhanced fallback mechanisms."""
@@ -33,70 +233,63 @@ class ArticleScraper:
             # Try different common image sources in RSS feeds
 
             # 1. Check for media:content (common in many feeds)
-            if hasattr(entry, "media_content") and entry.media_content:
-                for media in entry.media_content:
-                    if hasattr(media, "url") and media.url:
-                        if self._is_valid_image_url(media.url):
-                            return media.url
+            for media in getattr(entry, "media_content", None) or ():
+                url = getattr(media, "url", None)
+                if url and self._is_valid_image_url(url):
+                    return url
 
             # 2. Check for media:thumbnail
-            if hasattr(entry, "media_thumbnail") and entry.media_thumbnail:
-                for thumb in entry.media_thumbnail:
-                    if hasattr(thumb, "url") and thumb.url:
-                        if self._is_valid_image_url(thumb.url):
-                            return thumb.url
-
-            # 3. Check enclosures for images
-            if hasattr(entry, "enclosures") and entry.enclosures:
-                for enclosure in entry.enclosures:
-                    if hasattr(enclosure, "type") and hasattr(enclosure, "href"):
-                        if enclosure.type and enclosure.type.startswith("image/"):
-                            if self._is_valid_image_url(enclosure.href):
-                                return enclosure.href
-
-            # 4. Check links for image attachments
-            if hasattr(entry, "links") and entry.links:
-                for link in entry.links:
-                    if hasattr(link, "type") and hasattr(link, "href"):
-                        if link.type and link.type.startswith("image/"):
-                            if self._is_valid_image_url(link.href):
-                                return link.href
+            for thumb in getattr(entry, "media_thumbnail", None) or ():
+                url = getattr(thumb, "url", None)
+                if url and self._is_valid_image_url(url):
+                    return url
+
+            # 3. Check enclosures and 4. links for image attachments
+            for attachments in (getattr(entry, "enclosures", None), getattr(entry, "links", None)):
+                for attachment in attachments or ():
+                    mime_type = getattr(attachment, "type", None)
+                    href = getattr(attachment, "href", None)
+                    if mime_type and href and mime_type.startswith("image/"):
+                        if self._is_valid_image_url(href):
+                            return href
 
             # 5. Check custom RSS image fields (common extensions)
-            image_fields = ['image', 'featured_image', 'thumbnail', 'img', 'picture']
-            for field in image_fields:
-                if hasattr(entry, field):
-                    img_value = getattr(entry, field)
+            for field in _IMAGE_FIELDS:
+                img_value = getattr(entry, field, None)
+                if img_value is not None:
                     if isinstance(img_value, str) and img_value.strip():
                         if self._is_valid_image_url(img_value):
                             return img_value
-                    elif hasattr(img_value, 'href') and img_value.href:
+                    elif getattr(img_value, 'href', None):
                         if self._is_valid_image_url(img_value.href):
                             return img_value.href
 
             # 6. Parse summary/description for img tags
-            if hasattr(entry, "summary") and entry.summary:
-                img_url = self._extract_image_from_html(entry.summary)
+            summary = getattr(entry, "summary", None)
+            if summary:
+                img_url = self._extract_image_from_html(summary)
                 if img_url:
                     return img_url
 
             # 7. Parse content for img tags
-            if hasattr(entry, "content") and entry.content:
-                for content_item in entry.content:
-                    if hasattr(content_item, "value"):
-                        img_url = self._extract_image_from_html(content_item.value)
-                        if img_url:
-                            return img_url
+            for content_item in getattr(entry, "content", None) or ():
+                value = getattr(content_item, "value", None)
+                if value:
+                    img_url = self._extract_image_from_html(value)
+                    if img_url:
+                        return img_url
 
             # 8. Parse description for img tags (fallback)
-            if hasattr(entry, "description") and entry.description:
-                img_url = self._extract_image_from_html(entry.description)
+            description = getattr(entry, "description", None)
+            if description:
+                img_url = self._extract_image_from_html(description)
                 if img_url:
                     return img_url
 
             # 9. Try to extract from Open Graph or Twitter meta tags in the link
-            if hasattr(entry, "link") and entry.link:
-                img_url = self._extract_image_from_webpage(entry.link)
+            link = getattr(entry, "link", None)
+            if link:
+                img_url = self._extract_image_from_webpage(link)
                 if img_url:
                     return img_url
 
@@ -109,7 +302,17 @@ class ArticleScraper:
     def _extract_image_from_html(self, html_content: str) -> str:
         """Extract first image URL from HTML content with improved parsing."""
         try:
-            soup = BeautifulSoup(html_content, "html.parser")
+            # Fast path: the first <img> usually carries a plain src attribute
+            img_tag_match = _IMG_TAG_RE.search(html_content)
+            if not img_tag_match:
+                return ""
+            src_match = _IMG_SRC_RE.search(img_tag_match.group(0))
+            if src_match:
+                img_url = html.unescape(src_match.group(1))
+                if self._is_valid_image_url(img_url):
+                    return self._normalize_image_url(img_url)
+
+            soup = BeautifulSoup(html_content, _HTML_PARSER, parse_only=_IMG_STRAINER)
             
             # Look for img tags with various attributes
             img_tags = soup.find_all("img")
@@ -151,16 +354,16 @@ class ArticleScraper:
             return False
         
         # Must be HTTP/HTTPS or protocol-relative
-        if not (url.startswith('http://') or url.startswith('https://') or url.startswith('//')):
+        if not url.startswith(_IMAGE_URL_PREFIXES):
             return False
         
         # Skip common non-image extensions
-        skip_extensions = ['.pdf', '.doc', '.docx', '.zip', '.mp4', '.avi', '.mp3']
-        if any(url.lower().endswith(ext) for ext in skip_extensions):
+        lower = url.lower()
+        if lower.endswith(_NON_IMAGE_EXTENSIONS):
             return False
         
         # Skip obviously invalid URLs (but allow example.com for testing)
-        if any(invalid in url.lower() for invalid in ['localhost', '127.0.0.1']):
+        if any(invalid in lower for invalid in _LOCAL_HOSTS):
             return False
         
         # Skip too short URLs
@@ -205,38 +408,59 @@ class ArticleScraper:
             if not any(domain in page_url.lower() for domain in trusted_domains):
                 return ""
             
-            response = self.session.get(page_url, timeout=5, headers={'User-Agent': self.config.USER_AGENT})
-            if response.status_code != 200:
-                return ""
-            
-            soup = BeautifulSoup(response.content, "html.parser")
-            
-            # Check Open Graph image
-            og_image = soup.find("meta", property="og:image")
-            if og_image and og_image.get("content"):
-                img_url = og_image["content"]
-                if self._is_valid_image_url(img_url):
-                    return self._normalize_image_url(img_url)
-            
-            # Check Twitter Card image
-            twitter_image = soup.find("meta", attrs={"name": "twitter:image"})
-            if twitter_image and twitter_image.get("content"):
-                img_url = twitter_image["content"]
-                if self._is_valid_image_url(img_url):
-                    return self._normalize_image_url(img_url)
-            
-            # Check for article featured image meta tags
-            featured_meta = soup.find("meta", attrs={"name": "featured-image"})
-            if featured_meta and featured_meta.get("content"):
-                img_url = featured_meta["content"]
-                if self._is_valid_image_url(img_url):
-                    return self._normalize_image_url(img_url)
-            
-            return ""
+            # The same page is often tried twice (RSS entry, then image enhancement)
+            cached = self._page_image_cache.get(page_url)
+            if cached is not None:
+                return cached
             
+            img_url = self._fetch_page_image(page_url)
         except Exception as e:
             logger.debug(f"Error extracting image from webpage {page_url}: {e}")
-            return ""
+            img_url = ""
+        # Misses are cached too, so dead or image-less pages are fetched once per run
+        self._page_image_cache[page_url] = img_url
+        return img_url
+
+    def _fetch_page_image(self, page_url: str) -> str:
+        """Download ``page_url`` and return its Open Graph/Twitter/featured image."""
+        # Avoid overwhelming servers when several articles link to the same site
+        with self._page_fetch_slot(urlsplit(page_url).netloc):
+            # Only the start of the page is read, the rest is never downloaded
+            response = self.session.get(
+                page_url, timeout=5, stream=True, headers={'User-Agent': self.config.USER_AGENT}
+            )
+            try:
+                if response.status_code != 200:
+                    return ""
+                response.raw.decode_content = True
+                head = response.raw.read(_PAGE_HEAD_BYTES)
+            finally:
+                response.close()
+        
+        soup = BeautifulSoup(head, _HTML_PARSER, parse_only=_META_STRAINER)
+        
+        # Check Open Graph image
+        og_image = soup.find("meta", property="og:image")
+        if og_image and og_image.get("content"):
+            img_url = og_image["content"]
+            if self._is_valid_image_url(img_url):
+                return self._normalize_image_url(img_url)
+        
+        # Check Twitter Card image
+        twitter_image = soup.find("meta", attrs={"name": "twitter:image"})
+        if twitter_image and twitter_image.get("content"):
+            img_url = twitter_image["content"]
+            if self._is_valid_image_url(img_url):
+                return self._normalize_image_url(img_url)
+        
+        # Check for article featured image meta tags
+        featured_meta = soup.find("meta", attrs={"name": "featured-image"})
+        if featured_meta and featured_meta.get("content"):
+            img_url = featured_meta["content"]
+            if self._is_valid_image_url(img_url):
+                return self._normalize_image_url(img_url)
+        
+        return ""
 
     def _extract_medium_image(self, link_element) -> str:
         """Extract image URL from Medium article link context with enhanced methods."""
@@ -278,8 +502,7 @@ class ArticleScraper:
                     style = element.get("style", "")
                     if "background-image" in style:
                         # Extract URL from background-image: url(...)
-                        import re
-                        match = re.search(r'url\(["\']?(.*?)["\']?\)', style)
+                        match = _BG_IMAGE_RE.search(style)
                         if match:
                             img_url = match.group(1)
                             if self._is_valid_image_url(img_url):
@@ -302,15 +525,52 @@ class ArticleScraper:
             logger.debug(f"Error extracting Medium image: {e}")
             return ""
 
-    def get_rss_articles(self, feed_url: str, max_articles: int = 5) -> List[Dict[str, Any]]:
-        """Extract articles from RSS feed."""
+    def get_rss_articles(
+        self, feed_url: str, max_articles: int = 5, source: str = None
+    ) -> List[Article]:
+        """Extract articles from RSS feed.
+
+        ``source`` is the feed's host; it is derived from ``feed_url`` when the
+        caller has not precomputed it.
+        """
         try:
             logger.info(f"Fetching RSS feed: {feed_url}")
-            feed = feedparser.parse(feed_url)
+            # Conditional request: an unchanged feed answers 304 without a body
+            cached = self.feed_cache.get(feed_url)
+            headers = {}
+            if cached:
+                if cached.get("etag"):
+                    headers["If-None-Match"] = cached["etag"]
+                if cached.get("modified"):
+                    headers["If-Modified-Since"] = cached["modified"]
+
+            # Download through the pooled session (keep-alive, retries, timeout)
+            # rather than feedparser's own urllib fetch. The body is streamed:
+            # feedparser reads it straight off the (decompressing) raw stream
+            # instead of requests buffering a copy in response.content first
+            response = self.session.get(feed_url, timeout=10, stream=True, headers=headers)
+            try:
+                if response.status_code == 304 and cached:
+                    logger.info(f"RSS feed not modified, reusing cached articles: {feed_url}")
+                    return [dict(article) for article in cached["articles"][:max_articles]]
+
+                response.raise_for_status()
+                response.raw.decode_content = True
+                feed = feedparser.parse(
+                    response.raw,
+                    response_headers={
+                        "content-type": response.headers.get("Content-Type", ""),
+                        # Base for resolving relative links in the entries
+                        "content-location": response.url,
+                    },
+                )
+            finally:
+                response.close()
 
             if feed.bozo:
                 logger.warning(f"RSS feed has issues: {feed_url}")
 
+            source = source or urlparse(feed_url).netloc
             articles = []
             for entry in feed.entries[:max_articles]:
                 # Extract image from RSS entry
@@ -319,14 +579,25 @@ class ArticleScraper:
                 article = {
                     "title": getattr(entry, 'title', entry.get("title", "No Title") if hasattr(entry, 'get') else "No Title"),
                     "url": getattr(entry, 'link', entry.get("link", "") if hasattr(entry, 'get') else ""),
-                    "published": getattr(entry, 'published', entry.get("published", "") if hasattr(entry, 'get') else ""),
+                    "published": _published_iso(entry),
                     "summary": getattr(entry, 'summary', entry.get("summary", "") if hasattr(entry, 'get') else ""),
-                    "source": urlparse(feed_url).netloc,
-                    "tags": [tag.term for tag in getattr(entry, 'tags', entry.get("tags", []) if hasattr(entry, 'get') else [])],
+                    "source": source,
+                    # Tags are plain dicts; subscripting skips FeedParserDict's attribute
+                    # mapping, and tags without a term no longer fail the whole feed
+                    "tags": [
+                        tag["term"]
+                        for tag in getattr(entry, 'tags', entry.get("tags", ()) if hasattr(entry, 'get') else ())
+                        if tag.get("term")
+                    ],
                     "image": image_url,
                 }
                 articles.append(article)
 
+            etag = response.headers.get("ETag")
+            modified = response.headers.get("Last-Modified")
+            if etag or modified:
+                self.feed_cache[feed_url] = {"etag": etag, "modified": modified, "articles": articles}
+
             logger.info(f"Extracted {len(articles)} articles from {feed_url}")
             return articles
 
@@ -334,48 +605,53 @@ class ArticleScraper:
             logger.error(f"Error fetching RSS feed {feed_url}: {str(e)}")
             return []
 
-    def scrape_medium_trending(self, max_articles: int = 5) -> List[Dict[str, Any]]:
+    def scrape_medium_trending(self, max_articles: int = 5) -> List[Article]:
         """Scrape Medium trending articles."""
         try:
             url = "https://medium.com/tag/trending"
             response = self.session.get(url, timeout=10)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, "html.parser")
+            soup = BeautifulSoup(response.content, _HTML_PARSER)
+
+            # The page carries no dates; every link gets the same scrape time.
+            # It is UTC-aware, since _sort_articles reads naive times as UTC
+            published = datetime.now(timezone.utc).isoformat()
 
             articles = []
-            # Medium uses dynamic loading, so we'll try to find article links
-            article_links = soup.find_all("a", href=True)
+            # Medium uses dynamic loading, so we'll try to find article links;
+            # the href pattern is matched while searching, so other anchors are skipped
+            article_links = soup.find_all("a", href=_MEDIUM_ARTICLE_HREF_RE)
 
             for link in article_links:
-                href = link.get("href", "")
-                if "/p/" in href or "/@" in href:
-                    if href.startswith("/"):
-                        href = "https://medium.com" + href
-                    elif href.startswith("https://medium.com"):
-                        pass
-                    else:
-                        continue
+                href = link["href"]
+                if href.startswith("/"):
+                    href = "https://medium.com" + href
+                elif not href.startswith("https://medium.com"):
+                    continue
 
-                    title = link.get_text(strip=True)
-                    if title and len(title) > 10:  # Filter out short/empty titles
-                        # Try to extract image from the link's context
-                        image_url = self._extract_medium_image(link)
-
-                        articles.append(
-                            {
-                                "title": title,
-                                "url": href,
-                                "published": datetime.now().isoformat(),
-                                "summary": "",
-                                "source": "medium.com",
-                                "tags": ["trending"],
-                                "image": image_url,
-                            }
-                        )
+                # Plain-text anchors expose their only string directly; anchors
+                # with nested markup still need the recursive get_text walk
+                text = link.string
+                title = text.strip() if text is not None else link.get_text(strip=True)
+                if title and len(title) > 10:  # Filter out short/empty titles
+                    # Try to extract image from the link's context
+                    image_url = self._extract_medium_image(link)
+
+                    articles.append(
+                        {
+                            "title": title,
+                            "url": href,
+                            "published": published,
+                            "summary": "",
+                            "source": "medium.com",
+                            "tags": ["trending"],
+                            "image": image_url,
+                        }
+                    )
 
-                        if len(articles) >= max_articles:
-                            break
+                    if len(articles) >= max_articles:
+                        break
 
             logger.info(f"Scraped {len(articles)} trending articles from Medium")
             return articles
@@ -384,23 +660,43 @@ class ArticleScraper:
             logger.error(f"Error scraping Medium trending: {str(e)}")
             return []
 
-    def _fetch_rss_feed_safe(self, feed_info: tuple) -> List[Dict[str, Any]]:
+    def _wait_for_host(self, host: str, interval: float = _HOST_REQUEST_INTERVAL):
+        """Space requests to the same host at least ``interval`` seconds apart.
+
+        The slot is reserved under the lock and the sleep happens outside it,
+        so fetches for other hosts are never held up.
+        """
+        with self._host_lock:
+            now = time.monotonic()
+            start = max(now, self._host_next_request.get(host, 0.0))
+            self._host_next_request[host] = start + interval
+        if start > now:
+            time.sleep(start - now)
+
+    def _page_fetch_slot(self, host: str) -> BoundedSemaphore:
+        """Return the semaphore bounding concurrent page downloads from ``host``."""
+        with self._host_lock:
+            slot = self._page_fetch_slots.get(host)
+            if slot is None:
+                slot = self._page_fetch_slots[host] = BoundedSemaphore(_PAGE_FETCHES_PER_HOST)
+        return slot
+
+    def _fetch_rss_feed_safe(self, feed_info: tuple) -> List[Article]:
         """Thread-safe wrapper for RSS feed fetching."""
-        feed_name, feed_url, max_articles = feed_info
+        feed_name, feed_url, host, max_articles = feed_info
         try:
+            # Avoid overwhelming servers that host several of our feeds (medium.com)
+            self._wait_for_host(host)
             logger.info(f"🔄 Fetching {feed_name} in thread...")
-            articles = self.get_rss_articles(feed_url, max_articles)
+            articles = self.get_rss_articles(feed_url, max_articles, source=host)
             logger.info(f"✅ {feed_name}: Found {len(articles)} articles")
-
-            # Add a small random delay to avoid overwhelming servers
-            time.sleep(random.uniform(0.5, 1.5))
             return articles
 
         except Exception as e:
             logger.error(f"❌ Error processing feed {feed_name}: {e}")
             return []
 
-    def _fetch_medium_trending_safe(self, max_articles: int) -> List[Dict[str, Any]]:
+    def _fetch_medium_trending_safe(self, max_articles: int) -> List[Article]:
         """Thread-safe wrapper for Medium trending scraping."""
         try:
             logger.info("🔄 Fetching Medium trending in thread...")
@@ -414,40 +710,53 @@ class ArticleScraper:
 
     def scrape_inshorts_articles(
         self, categories: List[str] = None, max_articles_per_category: int = None
-    ) -> List[Dict[str, Any]]:
-        """Scrape articles from InShorts API."""
+    ) -> List[Article]:
+        """Scrape articles from InShorts API.
+
+        Categories are fetched concurrently; request starts are still spaced
+        RATE_LIMIT_DELAY apart, and the articles keep the category order.
+        """
         if categories is None:
-            categories = list(self.config.INSHORTS_CATEGORIES.keys())
+            categories = self.config.INSHORTS_CATEGORY_ORDER
 
-        all_articles = []
+        host = urlparse(self.config.INSHORTS_API_BASE_URL).netloc
 
-        for category in categories:
-            try:
-                category_config = self.config.INSHORTS_CATEGORIES.get(category, {"max_limit": 5})
-                max_limit = max_articles_per_category or category_config["max_limit"]
+        def fetch_category(category: str) -> List[Article]:
+            category_config = self.config.INSHORTS_CATEGORIES.get(category, {"max_limit": 5})
+            max_limit = max_articles_per_category or category_config["max_limit"]
 
-                logger.info(f"Fetching InShorts articles for category: {category}")
-                articles = self._fetch_inshorts_category(category, max_limit)
+            # Space requests to the API to be respectful
+            self._wait_for_host(host, self.config.RATE_LIMIT_DELAY)
+            logger.info(f"Fetching InShorts articles for category: {category}")
+            return self._fetch_inshorts_category(category, max_limit)
+
+        results = {}
+        max_workers = max(1, min(len(categories), _INSHORTS_WORKERS))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="inshorts") as executor:
+            future_to_category = {
+                executor.submit(fetch_category, category): category for category in categories
+            }
+            for future in as_completed(future_to_category):
+                category = future_to_category[future]
+                try:
+                    articles = future.result()
+                except Exception as e:
+                    logger.error(f"Error fetching InShorts {category}: {str(e)}")
+                    continue
 
                 if articles:
-                    all_articles.extend(articles)
+                    results[category] = articles
                     logger.info(f"Retrieved {len(articles)} articles from InShorts {category}")
                 else:
                     logger.warning(f"No articles found for InShorts {category}")
 
-                # Add delay between category requests to be respectful
-                time.sleep(self.config.RATE_LIMIT_DELAY)
-
-            except Exception as e:
-                logger.error(f"Error fetching InShorts {category}: {str(e)}")
-                continue
-
+        all_articles = [article for category in categories for article in results.get(category, ())]
         logger.info(f"Total InShorts articles retrieved: {len(all_articles)}")
         return all_articles
 
     def _fetch_inshorts_category(
         self, category: str, max_limit: int, news_offset: str = None
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Article]:
         """Fetch articles from a specific InShorts category."""
         try:
             # Build API URL
@@ -459,12 +768,12 @@ class ArticleScraper:
 
             # Make request with proper headers
             response = self.session.get(
-                url, params=params, headers=self.config.INSHORTS_HEADERS, timeout=10
+                url, params=params, headers=self.inshorts_headers, timeout=10
             )
             response.raise_for_status()
 
             # Parse JSON response
-            data = response.json()
+            data = _loads(response.content)
 
             # Extract articles from response
             articles = []
@@ -486,9 +795,14 @@ class ArticleScraper:
             logger.error(f"Unexpected error fetching InShorts {category}: {str(e)}")
             return []
 
-    def _parse_inshorts_article(self, item: Dict[str, Any], category: str) -> Dict[str, Any]:
+    def _parse_inshorts_article(self, item: Dict[str, Any], category: str) -> Optional[Article]:
         """Parse a single InShorts article from API response."""
         try:
+            # tags is always a list; DatabaseManager.save_articles stores it as is
+            tags = item.get("tags")
+            if not isinstance(tags, list):
+                tags = []
+
             # Extract article data
             article = {
                 "title": item.get("title", ""),
@@ -496,7 +810,7 @@ class ArticleScraper:
                 "published": item.get("created_at", ""),
                 "summary": item.get("content", ""),
                 "source": "inshorts.com",
-                "tags": item.get("tags", []) + [category],
+                "tags": tags + [category],
                 "image": item.get("image_url", ""),
                 "inshorts_id": item.get("hash_id", ""),
                 "original_source": item.get("source_name", ""),
@@ -531,10 +845,10 @@ class ArticleScraper:
         try:
             url = f"{self.config.INSHORTS_API_BASE_URL}/search/trending_topics"
 
-            response = self.session.get(url, headers=self.config.INSHORTS_HEADERS, timeout=10)
+            response = self.session.get(url, headers=self.inshorts_headers, timeout=10)
             response.raise_for_status()
 
-            data = response.json()
+            data = _loads(response.content)
 
             # Extract trending topics (structure may vary)
             topics = []
@@ -550,7 +864,7 @@ class ArticleScraper:
             logger.error(f"Error fetching InShorts trending topics: {str(e)}")
             return []
 
-    def _fetch_inshorts_safe(self, categories: List[str]) -> List[Dict[str, Any]]:
+    def _fetch_inshorts_safe(self, categories: List[str]) -> List[Article]:
         """Thread-safe wrapper for InShorts API scraping."""
         try:
             logger.info("🔄 Fetching InShorts articles in thread...")
@@ -562,7 +876,7 @@ class ArticleScraper:
             logger.error(f"❌ Error scraping InShorts: {e}")
             return []
 
-    def _enhance_articles_with_images(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _enhance_articles_with_images(self, articles: List[Article]) -> List[Article]:
         """Post-process articles to ensure maximum image coverage."""
         enhanced_articles = []
         articles_without_images = []
@@ -574,42 +888,46 @@ class ArticleScraper:
             else:
                 articles_without_images.append(article)
         
-        logger.info(f"Articles with images: {len(enhanced_articles)}, without images: {len(articles_without_images)}")
+        with_images_count = len(enhanced_articles)
+        logger.info(f"Articles with images: {with_images_count}, without images: {len(articles_without_images)}")
         
-        # Try to get images for articles without them
-        for article in articles_without_images:
-            enhanced_article = article.copy()
-            
-            # Try to extract image from the article URL
-            if article.get('url'):
-                try:
-                    img_url = self._extract_image_from_webpage(article['url'])
-                    if img_url:
-                        enhanced_article['image'] = img_url
-                        logger.debug(f"Found image for article: {article['title'][:50]}...")
-                    else:
-                        # As a last resort, try to find a generic image based on source or tags
-                        enhanced_article['image'] = self._get_fallback_image(article)
-                        
-                except Exception as e:
-                    logger.debug(f"Could not fetch image for {article['url']}: {e}")
-                    # Set a fallback image
-                    enhanced_article['image'] = self._get_fallback_image(article)
-            else:
-                enhanced_article['image'] = self._get_fallback_image(article)
+        # Try to get images for articles without them; lookups run concurrently and
+        # _fetch_page_image bounds how many pages one host serves at once
+        found_count = 0
+        if articles_without_images:
+            max_workers = min(len(articles_without_images), _IMAGE_LOOKUP_WORKERS)
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="images") as executor:
+                images = list(executor.map(self._find_article_image, articles_without_images))
             
-            enhanced_articles.append(enhanced_article)
-            
-            # Add small delay to avoid overwhelming servers
-            time.sleep(0.1)
+            for article, image in zip(articles_without_images, images):
+                enhanced_article = article.copy()
+                enhanced_article['image'] = image
+                if image:
+                    found_count += 1
+                enhanced_articles.append(enhanced_article)
         
-        final_with_images = sum(1 for article in enhanced_articles if article.get('image', '').strip())
+        final_with_images = with_images_count + found_count
         percentage = (final_with_images / len(enhanced_articles)) * 100 if enhanced_articles else 0
         logger.info(f"Final image coverage: {final_with_images}/{len(enhanced_articles)} articles ({percentage:.1f}%)")
         
         return enhanced_articles
 
-    def _get_fallback_image(self, article: Dict[str, Any]) -> str:
+    def _find_article_image(self, article: Article) -> str:
+        """Look up an image for an article that has none."""
+        # Try to extract image from the article URL
+        if article.get('url'):
+            try:
+                img_url = self._extract_image_from_webpage(article['url'])
+                if img_url:
+                    logger.debug(f"Found image for article: {article['title'][:50]}...")
+                    return img_url
+            except Exception as e:
+                logger.debug(f"Could not fetch image for {article['url']}: {e}")
+        
+        # As a last resort, try to find a generic image based on source or tags
+        return self._get_fallback_image(article)
+
+    def _get_fallback_image(self, article: Article) -> str:
         """Generate a fallback image URL based on article metadata."""
         # For now, return empty string. In production, this could:
         # 1. Use a placeholder service like https://via.placeholder.com/
@@ -623,9 +941,8 @@ class ArticleScraper:
         
         return ""
 
-    def scrape_daily_articles(self, target_count: int = None) -> List[Dict[str, Any]]:
+    def scrape_daily_articles(self, target_count: int = None) -> List[Article]:
         target_count = target_count or self.config.TARGET_ARTICLE_COUNT
-        all_articles = []
 
         logger.info("🚀 Starting multi-threaded article scraping...")
 
@@ -633,26 +950,21 @@ class ArticleScraper:
         tasks = []
 
         # Add RSS feeds to tasks
-        for feed_name, feed_url in self.config.RSS_FEEDS.items():
-            tasks.append(("rss", feed_name, feed_url, 3))
+        for feed_name, feed_url, host in self.config.RSS_FEED_TRIPLES:
+            tasks.append(("rss", feed_name, (feed_url, host), 3))
 
         # Add Medium publications to tasks
-        for i, pub_feed in enumerate(self.config.MEDIUM_PUBLICATIONS):
-            feed_name = f"medium_pub_{i+1}"
-            tasks.append(("rss", feed_name, pub_feed, 2))
+        for feed_name, pub_feed, host in self.config.MEDIUM_PUBLICATION_TRIPLES:
+            tasks.append(("rss", feed_name, (pub_feed, host), 2))
 
         # Add Medium trending as a special task
         tasks.append(("trending", "medium_trending", None, 5))
 
         # Add InShorts API as the highest priority task with more categories
-        inshorts_categories = [
-            "top_stories", "trending", "business", "technology", "world",
-            "sports", "entertainment", "science", "automobile", "politics"
-        ]
-        tasks.append(("inshorts", "inshorts_api", inshorts_categories, None))
+        tasks.append(("inshorts", "inshorts_api", self.config.INSHORTS_CATEGORY_ORDER, None))
 
-        # Use ThreadPoolExecutor for concurrent fetching
-        max_workers = min(len(tasks), 5)  # Limit to 5 concurrent threads
+        # Use ThreadPoolExecutor for concurrent fetching, bounded so remote servers aren't hammered
+        max_workers = min(len(tasks), self.config.MAX_CONCURRENT_FETCHES)
         logger.info(f"📊 Processing {len(tasks)} sources with {max_workers} worker threads")
 
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
@@ -663,8 +975,9 @@ class ArticleScraper:
                 task_type, name, url_or_data, max_articles = task
 
                 if task_type == "rss":
+                    feed_url, host = url_or_data
                     future = executor.submit(
-                        self._fetch_rss_feed_safe, (name, url_or_data, max_articles)
+                        self._fetch_rss_feed_safe, (name, feed_url, host, max_articles)
                     )
                 elif task_type == "trending":
                     future = executor.submit(self._fetch_medium_trending_safe, max_articles)
@@ -675,14 +988,15 @@ class ArticleScraper:
 
                 future_to_task[future] = (task_type, name)
 
-            # Collect results as they complete
+            # Collect results as they complete; only this thread reads the futures,
+            # so no lock is needed
+            results = {}
             for future in as_completed(future_to_task):
                 task_type, name = future_to_task[future]
                 try:
                     articles = future.result()
                     if articles:
-                        with self.articles_lock:
-                            all_articles.extend(articles)
+                        results[future] = articles
                         logger.info(f"✅ Completed {name}: Added {len(articles)} articles")
                     else:
                         logger.warning(f"⚠️ No articles from {name}")
@@ -690,9 +1004,13 @@ class ArticleScraper:
                 except Exception as exc:
                     logger.error(f"❌ {name} generated an exception: {exc}")
 
+        # Concatenate once, in submission order, so deduplication keeps the same
+        # copy of an article whichever source happened to finish first
+        all_articles = [article for future in future_to_task for article in results.get(future, ())]
         logger.info(
             f"🏁 Multi-threaded scraping completed. Total articles collected: {len(all_articles)}"
         )
+        self.save_feed_cache()
 
         # Remove duplicates based on URL
         unique_articles = self._remove_duplicates(all_articles)
@@ -711,21 +1029,21 @@ class ArticleScraper:
 
         return enhanced_articles
 
-    def _remove_duplicates(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Remove duplicate articles based on URL."""
-        unique_articles = []
-        seen_urls = set()
-
+    def _remove_duplicates(self, articles: List[Article]) -> List[Article]:
+        """Remove duplicate articles based on their normalized URL."""
+        # Insertion-ordered dict: setdefault keeps the first article per key
+        # with a single lookup
+        first_by_url: Dict[str, Article] = {}
         for article in articles:
             url = article.get("url", "")
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                unique_articles.append(article)
+            if url:
+                first_by_url.setdefault(_dedup_key(url), article)
+        unique_articles = list(first_by_url.values())
 
         logger.info(f"Removed {len(articles) - len(unique_articles)} duplicate articles")
         return unique_articles
 
-    def _sort_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _sort_articles(self, articles: List[Article]) -> List[Article]:
         """Sort articles by published date (newest first)."""
 
         def get_sort_key(article):
@@ -754,34 +1072,41 @@ class ArticleScraper:
 
         return sorted(articles, key=get_sort_key, reverse=True)
 
-    def save_articles_json(self, articles: List[Dict[str, Any]], filename: str = None) -> str:
-        """Save articles to JSON file."""
+    def save_articles_json(self, articles: List[Article], filename: str = None) -> str:
+        """Save articles to JSON file, gzip-compressed when the name ends in ``.gz``."""
         if filename is None:
-            filename = f"articles_{datetime.now().strftime('%Y%m%d')}.json"
+            filename = f"articles_{datetime.now().strftime('%Y%m%d')}.json.gz"
 
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(articles, f, indent=2, ensure_ascii=False, default=str)
+        payload = _dumps(articles)
+        if filename.endswith(".gz"):
+            payload = gzip.compress(payload, compresslevel=3)
+        Path(filename).write_bytes(payload)
 
         logger.info(f"Saved {len(articles)} articles to {filename}")
         return filename
 
-    def print_articles(self, articles: List[Dict[str, Any]]):
+    def print_articles(self, articles: List[Article]):
         """Print articles in a readable format."""
-        print(f"\n{'='*60}")
-        print(f"DAILY ARTICLE SCRAPER - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"{'='*60}")
-        print(f"Found {len(articles)} articles:")
+        # Assemble the report and write it once instead of one print per line
+        lines = [
+            f"\n{'='*60}",
+            f"DAILY ARTICLE SCRAPER - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"{'='*60}",
+            f"Found {len(articles)} articles:",
+        ]
 
         for i, article in enumerate(articles, 1):
-            print(f"\n{i}. {article['title']}")
-            print(f"   Source: {article['source']}")
-            print(f"   URL: {article['url']}")
+            lines.append(f"\n{i}. {article['title']}")
+            lines.append(f"   Source: {article['source']}")
+            lines.append(f"   URL: {article['url']}")
             if article.get("tags"):
-                print(f"   Tags: {', '.join(article['tags'])}")
+                lines.append(f"   Tags: {', '.join(article['tags'])}")
             if article["summary"]:
                 summary = article["summary"][:150]
-                print(f"   Summary: {summary}{'...' if len(article['summary']) > 150 else ''}")
+                lines.append(f"   Summary: {summary}{'...' if len(article['summary']) > 150 else ''}")
+
+        sys.stdout.write("\n".join(lines) + "\n")
 
-    def get_urls_only(self, articles: List[Dict[str, Any]]) -> List[str]:
+    def get_urls_only(self, articles: List[Article]) -> List[str]:
         """Extract only URLs from articles."""
         return [article["url"] for article in articles if article.get("url")]
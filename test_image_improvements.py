@@ -4,21 +4,17 @@ Test script to validate image URL improvements.
 Tests the enhanced image extraction capabilities.
 """
 
-import sys
-import os
 from unittest.mock import Mock, patch
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'config'))
 
 from src.scraper import ArticleScraper
-from config.settings import Config
+from config.settings import config
 
 def test_image_validation():
     """Test image URL validation logic."""
     print("🔍 Testing Image URL Validation")
     print("-" * 40)
     
-    scraper = ArticleScraper(Config())
+    scraper = ArticleScraper(config)
     
     test_urls = [
         ("https://example.com/image.jpg", True),
@@ -42,7 +38,7 @@ def test_rss_image_extraction():
     print("\n🔍 Testing RSS Image Extraction")
     print("-" * 40)
     
-    scraper = ArticleScraper(Config())
+    scraper = ArticleScraper(config)
     
     # Mock RSS entry with various image sources
     mock_entry = Mock()
@@ -87,7 +83,6 @@ def test_inshorts_priority():
     print("\n🔍 Testing InShorts Priority Configuration")
     print("-" * 40)
     
-    config = Config()
     
     print(f"Total InShorts categories: {len(config.INSHORTS_CATEGORIES)}")
     print("Categories with limits:")
@@ -137,7 +132,7 @@ def test_enhanced_scraping_mock():
         }
     ]
     
-    scraper = ArticleScraper(Config())
+    scraper = ArticleScraper(config)
     
     # Test image enhancement
     enhanced = scraper._enhance_articles_with_images(mock_articles)
@@ -15,15 +15,25 @@ def mock_config():
     config.RSS_FEEDS = {
         'test_feed': 'https://example.com/feed'
     }
+    config.RSS_FEED_TRIPLES = (('test_feed', 'https://example.com/feed', 'example.com'),)
     config.MEDIUM_PUBLICATIONS = ['https://example.com/medium/feed']
+    config.MEDIUM_PUBLICATION_TRIPLES = (
+        ('medium_pub_1', 'https://example.com/medium/feed', 'example.com'),
+    )
     config.TARGET_ARTICLE_COUNT = 5
     config.RATE_LIMIT_DELAY = 0.1
+    config.MAX_RETRIES = 1
+    config.MAX_CONCURRENT_FETCHES = 4
+    config.FEED_CACHE_FILE = ''
+    config.HTTP_CACHE_FILE = ''
     config.USER_AGENT = 'Test Agent'
     config.INSHORTS_API_BASE_URL = 'https://inshorts.com/api/en'
     config.INSHORTS_CATEGORIES = {
         'top_stories': {'max_limit': 10, 'priority': 1},
         'trending': {'max_limit': 8, 'priority': 2}
     }
+    config.INSHORTS_CATEGORY_ORDER = ('top_stories', 'trending')
+    config.INSHORTS_TOTAL_LIMIT = 18
     config.INSHORTS_HEADERS = {
         'accept': '*/*',
         'user-agent': 'Test Agent'
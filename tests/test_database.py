@@ -0,0 +1,297 @@
+"""Tests for the database module."""
+
+from datetime import datetime
+from unittest.mock import MagicMock, Mock
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, OperationFailure
+from src.database import DatabaseManager, _write_concern
+
+
+class TestDatabaseManager:
+    """Test cases for DatabaseManager class."""
+
+    def _manager(self):
+        db = DatabaseManager(uri='mongodb://example:27017/')
+        db.collection = Mock()
+        db.collection.with_options.return_value = db.collection
+        return db
+
+    def test_save_articles_without_connection(self, sample_articles):
+        """Test saving fails cleanly when not connected."""
+        db = DatabaseManager(uri='mongodb://example:27017/')
+        assert db.save_articles(sample_articles) is False
+
+    def test_save_articles_single_insert_many(self, sample_articles):
+        """Test new articles are inserted in one unordered batch."""
+        db = self._manager()
+        db.collection.insert_many.return_value = Mock(inserted_ids=['a', 'b'])
+
+        assert db.save_articles(sample_articles) is True
+
+        db.collection.insert_many.assert_called_once()
+        documents = db.collection.insert_many.call_args[0][0]
+        assert db.collection.insert_many.call_args[1]['ordered'] is False
+        assert db.collection.insert_many.call_args[1]['bypass_document_validation'] is True
+        assert [doc['url'] for doc in documents] == [a['url'] for a in sample_articles]
+        assert all('_id' not in doc and 'scraped_at' in doc for doc in documents)
+        assert db.collection.with_options.call_args[1]['write_concern'].document == {'w': 1, 'j': False}
+        db.collection.bulk_write.assert_not_called()
+
+    def test_save_articles_unacknowledged(self, sample_articles, monkeypatch):
+        """Test w=0 batches save without the validation bypass pymongo rejects."""
+        monkeypatch.setattr('src.database.BULK_WRITE_CONCERN', _write_concern('0'))
+        db = self._manager()
+        db.collection.insert_many.return_value = Mock(inserted_ids=['a', 'b'])
+        
+        assert db.save_articles(sample_articles) is True
+        assert db.collection.insert_many.call_args[1]['bypass_document_validation'] is False
+        assert db.collection.with_options.call_args[1]['write_concern'].acknowledged is False
+    
+    def test_save_articles_shared_scraped_at(self, sample_articles):
+        """Test the batch shares one scraped_at, stored as a datetime."""
+        db = self._manager()
+        db.collection.insert_many.return_value = Mock(inserted_ids=['a', 'b'])
+
+        db.save_articles(sample_articles)
+
+        documents = db.collection.insert_many.call_args[0][0]
+        assert isinstance(documents[0]['scraped_at'], datetime)
+        assert documents[0]['scraped_at'] is documents[1]['scraped_at']
+
+    def test_save_articles_published_datetime(self, sample_articles):
+        """Test a datetime published value is stored as ISO text."""
+        db = self._manager()
+        db.collection.insert_many.return_value = Mock(inserted_ids=['a', 'b'])
+        sample_articles[0]['published'] = datetime(2025, 1, 1, 12, 0)
+
+        db.save_articles(sample_articles)
+
+        documents = db.collection.insert_many.call_args[0][0]
+        assert documents[0]['published'] == '2025-01-01T12:00:00'
+
+    def test_save_articles_batches_large_writes(self, sample_articles, monkeypatch):
+        """Test articles are written in batches no larger than the batch size."""
+        monkeypatch.setattr('src.database.config', Mock(MONGODB_BATCH_SIZE=1))
+        db = self._manager()
+        db.collection.insert_many.return_value = Mock(inserted_ids=['a'])
+
+        assert db.save_articles(sample_articles) is True
+        assert db.collection.insert_many.call_count == 2
+        assert all(len(call[0][0]) == 1 for call in db.collection.insert_many.call_args_list)
+
+    def test_save_articles_update_existing(self, sample_articles):
+        """Test update_existing upserts only the articles that were already stored."""
+        db = self._manager()
+        db.collection.insert_many.side_effect = BulkWriteError({
+            'writeErrors': [{'index': 1, 'code': 11000, 'errmsg': 'duplicate key'}],
+            'nInserted': 1,
+        })
+        db.collection.bulk_write.return_value = Mock(upserted_count=0, matched_count=1)
+
+        assert db.save_articles(sample_articles, update_existing=True) is True
+
+        db.collection.bulk_write.assert_called_once()
+        operations = db.collection.bulk_write.call_args[0][0]
+        assert db.collection.bulk_write.call_args[1]['ordered'] is False
+        assert len(operations) == 1
+        assert all(isinstance(op, UpdateOne) for op in operations)
+
+        op = operations[0]
+        assert op._filter == {'url': sample_articles[1]['url']}
+        assert '_id' not in op._doc['$set']
+        assert op._doc['$set']['title'] == sample_articles[1]['title']
+        assert '$setOnInsert' not in op._doc
+
+    def test_save_articles_skips_duplicates_by_default(self, sample_articles):
+        """Test duplicates are not rewritten unless update_existing is set."""
+        db = self._manager()
+        db.collection.insert_many.side_effect = BulkWriteError({
+            'writeErrors': [{'index': 1, 'code': 11000, 'errmsg': 'duplicate key'}],
+            'nInserted': 1,
+        })
+
+        assert db.save_articles(sample_articles) is True
+        db.collection.bulk_write.assert_not_called()
+
+    def test_save_articles_partial_bulk_failure(self, sample_articles):
+        """Test a partially failed batch is reported as a failure."""
+        db = self._manager()
+        db.collection.insert_many.side_effect = BulkWriteError({
+            'writeErrors': [{'index': 1, 'code': 2, 'errmsg': 'bad value'}],
+            'nInserted': 1,
+        })
+
+        assert db.save_articles(sample_articles) is False
+
+    def test_save_articles_only_failures(self, sample_articles):
+        """Test a batch where every write failed reports nothing saved."""
+        db = self._manager()
+        db.collection.insert_many.side_effect = BulkWriteError({
+            'writeErrors': [
+                {'index': 0, 'code': 2, 'errmsg': 'bad value'},
+                {'index': 1, 'code': 2, 'errmsg': 'bad value'},
+            ],
+            'nInserted': 0,
+        })
+
+        assert db.save_articles(sample_articles, update_existing=True) is False
+
+    def test_save_articles_only_duplicates(self, sample_articles):
+        """Test duplicate-key errors count as already saved."""
+        db = self._manager()
+        db.collection.insert_many.side_effect = BulkWriteError({
+            'writeErrors': [
+                {'index': 0, 'code': 11000, 'errmsg': 'duplicate key'},
+                {'index': 1, 'code': 11000, 'errmsg': 'duplicate key'},
+            ],
+            'nInserted': 0,
+        })
+
+        assert db.save_articles(sample_articles) is True
+
+    def test_save_articles_skips_missing_urls(self, sample_articles):
+        """Test articles without a URL never reach the database."""
+        db = self._manager()
+        sample_articles[1]['url'] = ''
+        db.collection.insert_many.return_value = Mock(inserted_ids=['a'])
+
+        assert db.save_articles(sample_articles) is True
+        assert len(db.collection.insert_many.call_args[0][0]) == 1
+
+    def test_get_article_count_estimated(self):
+        """Test the default count uses collection metadata instead of a scan."""
+        db = self._manager()
+        db.collection.estimated_document_count.return_value = 42
+
+        assert db.get_article_count() == 42
+        db.collection.count_documents.assert_not_called()
+
+    def test_get_article_count_exact(self):
+        """Test exact=True counts the documents."""
+        db = self._manager()
+        db.collection.count_documents.return_value = 41
+
+        assert db.get_article_count(exact=True) == 41
+        db.collection.estimated_document_count.assert_not_called()
+
+    def test_create_indexes_single_command(self, monkeypatch):
+        """Test all indexes are sent in one createIndexes command."""
+        monkeypatch.setattr('src.database.DatabaseManager._INDEXES_BUILT', set())
+        db = self._manager()
+        db.collection.full_name = 'test.articles'
+
+        db.create_indexes()
+        db.create_indexes()
+
+        db.collection.create_indexes.assert_called_once()
+        keys = [model.document['key'] for model in db.collection.create_indexes.call_args[0][0]]
+        assert [list(key) for key in keys] == [['url'], ['scraped_at'], ['source'], ['published']]
+        db.collection.create_index.assert_not_called()
+
+    def test_create_indexes_converts_scraped_at_to_ttl(self, monkeypatch):
+        """Test an existing plain scraped_at index is converted to a TTL index."""
+        monkeypatch.setattr('src.database.DatabaseManager._INDEXES_BUILT', set())
+        monkeypatch.setattr(
+            'src.database.config',
+            Mock(AUTO_CLEANUP_ENABLED=True, AUTO_CLEANUP_TTL=True, CLEANUP_MONTHS_OLD=2),
+        )
+        db = self._manager()
+        db.collection.full_name = 'test.articles'
+        db.database = Mock()
+        db.collection.create_indexes.side_effect = [OperationFailure('conflict', code=85), None]
+
+        db.create_indexes()
+
+        db.database.command.assert_called_once()
+        assert db.database.command.call_args[1]['index'] == {
+            'keyPattern': {'scraped_at': 1},
+            'expireAfterSeconds': 2 * 30 * 24 * 60 * 60,
+        }
+        assert db.collection.create_indexes.call_count == 2
+
+    def test_create_indexes_removes_ttl_when_disabled(self, monkeypatch):
+        """Test switching TTL cleanup off rebuilds scraped_at without expiry."""
+        monkeypatch.setattr('src.database.DatabaseManager._INDEXES_BUILT', set())
+        monkeypatch.setattr(
+            'src.database.config',
+            Mock(AUTO_CLEANUP_ENABLED=True, AUTO_CLEANUP_TTL=False, CLEANUP_MONTHS_OLD=2),
+        )
+        db = self._manager()
+        db.collection.full_name = 'test.articles'
+        db.database = Mock()
+        db.collection.create_indexes.side_effect = [OperationFailure('conflict', code=85), None]
+        db.collection.index_information.return_value = {
+            'scraped_at_1': {'key': [('scraped_at', 1)], 'expireAfterSeconds': 5184000},
+        }
+        
+        db.create_indexes()
+        
+        db.collection.drop_index.assert_called_once_with('scraped_at_1')
+        db.database.command.assert_not_called()
+        assert db.collection.create_indexes.call_count == 2
+        scraped_at = db.collection.create_indexes.call_args[0][0][1].document
+        assert 'expireAfterSeconds' not in scraped_at
+    
+    def test_has_ttl_index(self):
+        """Test the TTL check reads expireAfterSeconds off the scraped_at index."""
+        db = self._manager()
+        db.collection.index_information.return_value = {
+            '_id_': {'key': [('_id', 1)]},
+            'scraped_at_1': {'key': [('scraped_at', 1)]},
+        }
+        assert db.has_ttl_index() is False
+        
+        db.collection.index_information.return_value['scraped_at_1']['expireAfterSeconds'] = 5184000
+        assert db.has_ttl_index() is True
+        
+        db.collection.index_information.side_effect = OperationFailure('not authorized', code=13)
+        assert db.has_ttl_index() is False
+    
+    def test_connect_shares_client(self, monkeypatch):
+        """Test managers for the same URI reuse one pooled client."""
+        monkeypatch.setattr('src.database.DatabaseManager._CLIENTS', {})
+        client_cls = MagicMock()
+        monkeypatch.setattr('src.database.MongoClient', client_cls)
+
+        first = DatabaseManager(uri='mongodb://example:27017/')
+        second = DatabaseManager(uri='mongodb://example:27017/')
+        assert first.connect() is True
+        first.disconnect()
+        assert second.connect() is True
+
+        client_cls.assert_called_once()
+        assert client_cls.call_args[1]['appname'] == 'daily-article-scrapper'
+        assert second.client is client_cls.return_value
+        client_cls.return_value.close.assert_not_called()
+
+    def test_write_concern_from_config(self):
+        """Test MONGODB_WRITE_CONCERN values map to write concerns."""
+        assert _write_concern('1').document == {'w': 1, 'j': False}
+        assert _write_concern('0').document == {'w': 0, 'j': False}
+        assert _write_concern('majority').document == {'w': 'majority'}
+
+    def test_get_recent_articles_projection(self):
+        """Test recent articles fetch only the listing fields by default."""
+        db = self._manager()
+        cursor = db.collection.find.return_value
+        cursor.sort.return_value = cursor
+        cursor.limit.return_value = cursor
+        cursor.batch_size.return_value = [{'title': 'Test', 'url': 'https://example.com'}]
+
+        assert db.get_recent_articles(days=1, limit=10) == [{'title': 'Test', 'url': 'https://example.com'}]
+        projection = db.collection.find.call_args[0][1]
+        assert 'summary' not in projection and projection['url'] == 1
+        cursor.batch_size.assert_called_once_with(10)
+
+    def test_save_articles_copies_unless_consumed(self, sample_articles):
+        """Test the caller's articles are only modified with consume=True."""
+        db = self._manager()
+        db.collection.insert_many.return_value = Mock(inserted_ids=['a', 'b'])
+
+        db.save_articles(sample_articles)
+        assert 'scraped_at' not in sample_articles[0]
+
+        db.save_articles(sample_articles, consume=True)
+        documents = db.collection.insert_many.call_args[0][0]
+        assert documents[0] is sample_articles[0]
+        assert 'scraped_at' in sample_articles[0]
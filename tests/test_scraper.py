@@ -1,7 +1,13 @@
 """Tests for the article scraper module."""
 
+import feedparser
+import gzip
+import json
 import pytest
 import requests
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
 from src.scraper import ArticleScraper
 
@@ -15,6 +21,40 @@ class TestArticleScraper:
         assert scraper.config == mock_config
         assert scraper.session is not None
     
+    def test_init_reuses_session(self, mock_config):
+        """Test that a caller-provided session is shared instead of rebuilt."""
+        session = requests.Session()
+        scraper = ArticleScraper(config=mock_config, session=session)
+        assert scraper.session is session
+    
+    def test_session_retries_transient_statuses(self, mock_config):
+        """Test the session adapter pools connections and retries gateway errors."""
+        scraper = ArticleScraper(config=mock_config)
+        adapter = scraper.session.get_adapter('https://example.com/feed')
+        
+        assert adapter.max_retries.total == mock_config.MAX_RETRIES
+        assert 503 in adapter.max_retries.status_forcelist
+        assert adapter.max_retries.raise_on_status is False
+        assert adapter.max_retries.respect_retry_after_header is True
+        
+        # A throttling server's wait is honoured, but only up to the cap
+        throttled = Mock(headers={'Retry-After': '3600'})
+        assert adapter.max_retries.get_retry_after(throttled) == 10.0
+        polite = Mock(headers={'Retry-After': '2'})
+        assert adapter.max_retries.get_retry_after(polite) == 2
+        # Retries after the first attempt keep the cap
+        assert adapter.max_retries.increment('GET', '/feed').get_retry_after(throttled) == 10.0
+    
+    def test_init_http_cache(self, mock_config):
+        """Test HTTP_CACHE_FILE switches to a cached session when requests-cache is present."""
+        mock_config.HTTP_CACHE_FILE = '.http_cache.sqlite'
+        cached_session = Mock()
+        with patch('src.scraper.CachedSession', return_value=cached_session) as session_cls:
+            scraper = ArticleScraper(config=mock_config)
+        
+        assert scraper.session is cached_session
+        assert session_cls.call_args[0][0] == '.http_cache.sqlite'
+    
     def test_remove_duplicates(self, scraper, sample_articles):
         """Test duplicate removal functionality."""
         # Add a duplicate article
@@ -25,6 +65,46 @@ class TestArticleScraper:
         assert len(unique_articles) == 2
         assert unique_articles == sample_articles
     
+    def test_remove_duplicates_normalizes_urls(self, scraper):
+        """Test links differing only in scheme, case, slash or utm_* are duplicates."""
+        articles = [
+            {'url': 'https://Example.com/post?id=1&utm_source=rss'},
+            {'url': 'http://example.com/post/?id=1'},
+            {'url': 'https://example.com/post?id=2'},
+        ]
+        
+        unique_articles = scraper._remove_duplicates(articles)
+        
+        assert [a['url'] for a in unique_articles] == [
+            'https://Example.com/post?id=1&utm_source=rss',
+            'https://example.com/post?id=2',
+        ]
+    
+    def test_print_articles(self, scraper, sample_articles, capsys):
+        """Test the console report lists every article."""
+        scraper.print_articles(sample_articles)
+        
+        output = capsys.readouterr().out
+        assert 'Found 2 articles:' in output
+        assert '\n1. Test Article 1\n   Source: example.com\n   URL: https://example.com/article1\n' in output
+        assert '   Tags: ai\n   Summary: Test summary 2\n' in output
+    
+    def test_save_articles_json(self, scraper, sample_articles, tmp_path):
+        """Test the JSON backup round-trips the articles."""
+        filename = str(tmp_path / 'articles.json')
+        
+        assert scraper.save_articles_json(sample_articles, filename) == filename
+        with open(filename, encoding='utf-8') as f:
+            assert json.load(f) == sample_articles
+    
+    def test_save_articles_json_gzip(self, scraper, sample_articles, tmp_path):
+        """Test a .gz backup name produces a gzip-compressed JSON file."""
+        filename = str(tmp_path / 'articles.json.gz')
+        
+        assert scraper.save_articles_json(sample_articles, filename) == filename
+        with gzip.open(filename, 'rt', encoding='utf-8') as f:
+            assert json.load(f) == sample_articles
+    
     def test_get_urls_only(self, scraper, sample_articles):
         """Test URL extraction."""
         urls = scraper.get_urls_only(sample_articles)
@@ -35,15 +115,20 @@ class TestArticleScraper:
         ]
         assert urls == expected_urls
     
+    @patch('src.scraper.requests.Session.get')
     @patch('src.scraper.feedparser.parse')
-    def test_get_rss_articles(self, mock_parse, scraper):
+    def test_get_rss_articles(self, mock_parse, mock_get, scraper):
         """Test RSS article extraction."""
+        mock_get.return_value = Mock(
+            raw=Mock(), headers={'Content-Type': 'application/rss+xml'}, url='https://example.com/feed'
+        )
         # Mock feedparser response
         mock_entry = Mock()
         # Set up both attribute and dict-style access
         mock_entry.title = 'Test Article'
         mock_entry.link = 'https://example.com/test'
-        mock_entry.published = '2025-01-01'
+        mock_entry.published = 'Wed, 01 Jan 2025 08:30:00 GMT'
+        mock_entry.published_parsed = time.struct_time((2025, 1, 1, 8, 30, 0, 2, 1, 0))
         mock_entry.summary = 'Test summary'
         mock_entry.get.side_effect = lambda key, default='': {
             'title': 'Test Article',
@@ -51,7 +136,7 @@ class TestArticleScraper:
             'published': '2025-01-01',
             'summary': 'Test summary'
         }.get(key, default)
-        mock_entry.tags = []
+        mock_entry.tags = [{'term': 'python', 'scheme': None}, {'term': None}]
         mock_entry.media_content = []
         mock_entry.media_thumbnail = []
         mock_entry.enclosures = []
@@ -72,7 +157,38 @@ class TestArticleScraper:
         assert len(articles) == 1
         assert articles[0]['title'] == 'Test Article'
         assert articles[0]['url'] == 'https://example.com/test'
+        assert articles[0]['published'] == '2025-01-01T08:30:00+00:00'
+        assert articles[0]['tags'] == ['python']
         assert 'image' in articles[0]  # Ensure image field is present
+        mock_get.assert_called_once_with('https://example.com/feed', timeout=10, stream=True, headers={})
+        assert mock_parse.call_args[0][0] is mock_get.return_value.raw
+        mock_get.return_value.close.assert_called_once()
+        assert mock_parse.call_args[1]['response_headers']['content-type'] == 'application/rss+xml'
+    
+    @patch('src.scraper.requests.Session.get')
+    def test_get_rss_articles_not_modified(self, mock_get, mock_config, tmp_path):
+        """Test a 304 answer reuses the cached articles without parsing."""
+        cache_file = tmp_path / 'feed_cache.json'
+        cache_file.write_text(json.dumps({
+            'https://example.com/feed': {
+                'etag': '"abc"',
+                'modified': None,
+                'articles': [{'title': 'Cached', 'url': 'https://example.com/cached'}],
+            }
+        }))
+        mock_config.FEED_CACHE_FILE = str(cache_file)
+        scraper = ArticleScraper(config=mock_config)
+        mock_get.return_value = Mock(status_code=304)
+        
+        with patch('src.scraper.feedparser.parse') as mock_parse:
+            articles = scraper.get_rss_articles('https://example.com/feed')
+        
+        assert articles == [{'title': 'Cached', 'url': 'https://example.com/cached'}]
+        assert mock_get.call_args[1]['headers'] == {'If-None-Match': '"abc"'}
+        mock_parse.assert_not_called()
+        
+        scraper.save_feed_cache()
+        assert 'https://example.com/feed' in json.loads(cache_file.read_text())
     
     def test_extract_image_from_html(self, scraper):
         """Test image extraction from HTML content."""
@@ -85,6 +201,98 @@ class TestArticleScraper:
         image_url = scraper._extract_image_from_html(html_no_image)
         assert image_url == ''
     
+    def test_extract_image_from_html_attribute_variants(self, scraper):
+        """Test entity decoding and the lazy-loading fallback."""
+        html_entities = '<img alt="x" src="https://example.com/a.jpg?w=1&amp;h=2">'
+        assert scraper._extract_image_from_html(html_entities) == 'https://example.com/a.jpg?w=1&h=2'
+        
+        html_lazy = '<img data-src="https://example.com/lazy.jpg" src="data:image/gif;base64,R0l">'
+        assert scraper._extract_image_from_html(html_lazy) == 'https://example.com/lazy.jpg'
+    
+    @patch('src.scraper.requests.Session.get')
+    def test_extract_image_from_webpage(self, mock_get, scraper):
+        """Test the Open Graph image is read from a trusted article page."""
+        page = Mock(status_code=200)
+        page.raw.read.return_value = b"""
+            <html><head>
+            <meta name="twitter:image" content="https://cdn.example.com/twitter.jpg">
+            <meta property="og:image" content="https://cdn.example.com/og.jpg">
+            </head><body><img src="https://cdn.example.com/body.jpg"></body></html>
+        """
+        mock_get.return_value = page
+        
+        assert scraper._extract_image_from_webpage('https://www.bbc.com/news/test') == 'https://cdn.example.com/og.jpg'
+        assert scraper._extract_image_from_webpage('https://untrusted.example/post') == ''
+        mock_get.assert_called_once()
+        assert mock_get.call_args[1]['stream'] is True
+        page.raw.read.assert_called_once_with(64 * 1024)
+        page.close.assert_called_once()
+        
+        # Repeat lookups, including misses, are answered from the cache
+        mock_get.return_value = Mock(status_code=404)
+        assert scraper._extract_image_from_webpage('https://www.bbc.com/news/missing') == ''
+        assert scraper._extract_image_from_webpage('https://www.bbc.com/news/missing') == ''
+        assert scraper._extract_image_from_webpage('https://www.bbc.com/news/test') == 'https://cdn.example.com/og.jpg'
+        assert mock_get.call_count == 2
+    
+    @patch('src.scraper.requests.Session.get')
+    def test_fetch_page_image_reads_page_head(self, mock_get, scraper):
+        """Test only the start of the decompressed page is read before closing."""
+        page = Mock(status_code=200)
+        page.raw.read.return_value = b'<head><meta property="og:image" content="https://cdn.example.com/og.jpg">'
+        mock_get.return_value = page
+        
+        assert scraper._fetch_page_image('https://www.bbc.com/news/a') == 'https://cdn.example.com/og.jpg'
+        assert page.raw.decode_content is True
+        page.raw.read.assert_called_once_with(64 * 1024)
+        page.close.assert_called_once()
+        
+        error_page = Mock(status_code=500)
+        mock_get.return_value = error_page
+        assert scraper._fetch_page_image('https://www.bbc.com/news/b') == ''
+        error_page.raw.read.assert_not_called()
+        error_page.close.assert_called_once()
+    
+    def test_fetch_page_image_bounds_requests_per_host(self, scraper):
+        """Test concurrent page downloads from one host are capped without sleeping."""
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+        
+        def fake_get(url, **kwargs):
+            with lock:
+                in_flight.append(url)
+                peak.append(len(in_flight))
+            time.sleep(0.02)
+            with lock:
+                in_flight.remove(url)
+            return Mock(status_code=404)
+        
+        urls = [f'https://www.bbc.com/news/{i}' for i in range(6)]
+        with patch.object(scraper.session, 'get', side_effect=fake_get), \
+                patch.object(scraper, '_wait_for_host') as mock_wait:
+            with ThreadPoolExecutor(max_workers=6) as executor:
+                assert list(executor.map(scraper._fetch_page_image, urls)) == [''] * 6
+        
+        assert max(peak) <= 2
+        mock_wait.assert_not_called()
+    
+    def test_enhance_articles_with_images(self, scraper):
+        """Test looked-up images are written back to the matching articles."""
+        articles = [
+            {'url': 'https://example.com/a', 'image': ''},
+            {'url': 'https://example.com/b', 'image': 'https://example.com/b.jpg'},
+            {'url': 'https://example.com/c', 'image': ''},
+        ]
+        scraper._find_article_image = lambda article: article['url'] + '.png'
+        
+        enhanced = scraper._enhance_articles_with_images(articles)
+        
+        assert [a['image'] for a in enhanced] == [
+            'https://example.com/b.jpg', 'https://example.com/a.png', 'https://example.com/c.png',
+        ]
+        assert articles[0]['image'] == ''
+    
     def test_extract_image_from_rss_entry(self, scraper):
         """Test image extraction from RSS entry."""
         # Mock RSS entry with media content
@@ -108,6 +316,50 @@ class TestArticleScraper:
         image_url = scraper._extract_image_from_rss_entry(empty_entry)
         assert image_url == ''
     
+    def test_extract_image_from_rss_entry_attachments(self, scraper):
+        """Test image enclosures and links on a parsed feed entry."""
+        entry = feedparser.FeedParserDict(
+            enclosures=[feedparser.FeedParserDict(type='audio/mpeg', href='https://example.com/a.mp3')],
+            links=[
+                feedparser.FeedParserDict(type='text/html', href='https://example.com/post'),
+                feedparser.FeedParserDict(type='image/png', href='https://example.com/cover.png'),
+            ],
+        )
+        
+        assert scraper._extract_image_from_rss_entry(entry) == 'https://example.com/cover.png'
+    
+    @patch('src.scraper.requests.Session.get')
+    def test_scrape_medium_trending(self, mock_get, scraper):
+        """Test only Medium article links with real titles are kept."""
+        mock_get.return_value = Mock(content=b"""
+            <div><a href="/@writer/a-long-article-title-123">A long article title</a></div>
+            <div><a href="/p/abc123">Short</a></div>
+            <div><a href="/p/def456"><h2>Nested</h2> <span>title markup</span></a></div>
+            <div><a href="https://example.com/@elsewhere/post">Some other site's post</a></div>
+            <div><a href="/tag/trending">Trending articles on Medium</a></div>
+        """)
+        
+        articles = scraper.scrape_medium_trending(max_articles=5)
+        
+        assert [a['url'] for a in articles] == [
+            'https://medium.com/@writer/a-long-article-title-123',
+            'https://medium.com/p/def456',
+        ]
+        assert [a['title'] for a in articles] == ['A long article title', 'Nestedtitle markup']
+        assert articles[0]['published'] == articles[1]['published']
+        assert articles[0]['published'].endswith('+00:00')
+    
+    @patch('src.scraper.time.sleep')
+    def test_wait_for_host_spaces_same_host_only(self, mock_sleep, scraper):
+        """Test only repeat requests to one host wait for their slot."""
+        scraper._wait_for_host('medium.com', interval=1.0)
+        scraper._wait_for_host('example.com', interval=1.0)
+        mock_sleep.assert_not_called()
+        
+        scraper._wait_for_host('medium.com', interval=1.0)
+        mock_sleep.assert_called_once()
+        assert 0 < mock_sleep.call_args[0][0] <= 1.0
+    
     @patch('src.scraper.time.sleep')
     @patch.object(ArticleScraper, 'get_rss_articles')
     @patch.object(ArticleScraper, 'scrape_medium_trending')
@@ -140,7 +392,7 @@ class TestArticleScraper:
         """Test InShorts API scraping."""
         # Mock successful API response
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             'data': {
                 'news_list': [
                     {
@@ -155,7 +407,7 @@ class TestArticleScraper:
                     }
                 ]
             }
-        }
+        }).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
@@ -169,6 +421,21 @@ class TestArticleScraper:
         assert 'image' in articles[0]
         mock_get.assert_called()
     
+    @patch('src.scraper.time.sleep')
+    @patch.object(ArticleScraper, '_fetch_inshorts_category')
+    def test_scrape_inshorts_articles_keeps_category_order(self, mock_fetch, mock_sleep, scraper):
+        """Test concurrent category fetches are paced and returned in category order."""
+        scraper.config.RATE_LIMIT_DELAY = 30
+        mock_fetch.side_effect = lambda category, max_limit: [{'url': f'https://example.com/{category}'}]
+        
+        articles = scraper.scrape_inshorts_articles(['top_stories', 'trending'])
+        
+        assert [a['url'] for a in articles] == [
+            'https://example.com/top_stories',
+            'https://example.com/trending',
+        ]
+        mock_sleep.assert_called_once()  # Second request waits for its slot
+    
     @patch('src.scraper.requests.Session.get')
     def test_fetch_inshorts_category_error_handling(self, mock_get, scraper):
         """Test InShorts API error handling."""
@@ -185,7 +452,7 @@ class TestArticleScraper:
         """Test InShorts API invalid JSON handling."""
         # Mock invalid JSON response
         mock_response = Mock()
-        mock_response.json.side_effect = ValueError("Invalid JSON")
+        mock_response.content = b"Invalid JSON"
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
@@ -227,12 +494,24 @@ class TestArticleScraper:
         
         assert article is None  # Should return None for invalid articles
     
+    def test_parse_inshorts_article_non_list_tags(self, scraper):
+        """Test non-list InShorts tags are replaced with the category only."""
+        item = {
+            'title': 'Test Article',
+            'source_url': 'https://example.com/test',
+            'tags': None,
+        }
+        
+        article = scraper._parse_inshorts_article(item, 'top_stories')
+        
+        assert article['tags'] == ['top_stories']
+    
     @patch('src.scraper.requests.Session.get')
     def test_get_inshorts_trending_topics(self, mock_get, scraper):
         """Test getting trending topics from InShorts."""
         # Mock successful API response
         mock_response = Mock()
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             'data': {
                 'topics': [
                     {'name': 'Technology'},
@@ -240,7 +519,7 @@ class TestArticleScraper:
                     {'name': 'Science'}
                 ]
             }
-        }
+        }).encode()
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
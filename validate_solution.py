@@ -5,24 +5,20 @@ This script validates all the improvements made to achieve 99% image URL coverag
 """
 
 import sys
-import os
 from unittest.mock import Mock, patch, MagicMock
 from types import SimpleNamespace
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'config'))
 
 from src.scraper import ArticleScraper
-from config.settings import Config
+from config.settings import config
 
 def validate_inshorts_prioritization():
     """Validate InShorts API prioritization improvements."""
     print("🎯 Validating InShorts API Prioritization")
     print("-" * 50)
     
-    config = Config()
     
     # Count total potential articles
-    total_articles = sum(cat['max_limit'] for cat in config.INSHORTS_CATEGORIES.values())
+    total_articles = config.INSHORTS_TOTAL_LIMIT
     categories_count = len(config.INSHORTS_CATEGORIES)
     
     print(f"✅ Categories increased: {categories_count} (was 4)")
@@ -30,9 +26,9 @@ def validate_inshorts_prioritization():
     print(f"✅ Improvement: {(total_articles/28)*100:.0f}% increase in InShorts coverage")
     
     # Validate priority ordering
-    sorted_categories = sorted(config.INSHORTS_CATEGORIES.items(), key=lambda x: x[1]['priority'])
     print("\n📊 Priority order (top 5):")
-    for i, (category, settings) in enumerate(sorted_categories[:5]):
+    for category in config.INSHORTS_CATEGORY_ORDER[:5]:
+        settings = config.INSHORTS_CATEGORIES[category]
         print(f"  {settings['priority']}. {category}: {settings['max_limit']} articles")
     
     return total_articles
@@ -42,7 +38,7 @@ def validate_enhanced_extraction():
     print("\n🔍 Validating Enhanced Image Extraction")
     print("-" * 50)
     
-    scraper = ArticleScraper(Config())
+    scraper = ArticleScraper(config)
     
     # Test 1: Image URL validation
     test_urls = [
@@ -87,7 +83,7 @@ def validate_enhanced_extraction():
     with patch.object(scraper.session, 'get') as mock_get:
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.content = mock_html.encode('utf-8')
+        mock_response.raw.read.return_value = mock_html.encode('utf-8')
         mock_get.return_value = mock_response
         
         webpage_image = scraper._extract_image_from_webpage('https://techcrunch.com/test')
@@ -102,7 +98,7 @@ def validate_end_to_end_coverage():
     print("\n🎯 Validating End-to-End Image Coverage")
     print("-" * 50)
     
-    scraper = ArticleScraper(Config())
+    scraper = ArticleScraper(config)
     
     # Create test articles mix
     test_articles = [
@@ -156,7 +152,7 @@ def validate_end_to_end_coverage():
     with patch.object(scraper.session, 'get') as mock_get:
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.content = mock_html.encode('utf-8')
+        mock_response.raw.read.return_value = mock_html.encode('utf-8')
         mock_get.return_value = mock_response
         
         enhanced_articles = scraper._enhance_articles_with_images(test_articles)
@@ -179,7 +175,6 @@ def validate_performance_impact():
     print("\n⚡ Validating Performance Impact")
     print("-" * 50)
     
-    config = Config()
     
     # Check rate limiting is configured
     rate_limit_configured = hasattr(config, 'RATE_LIMIT_DELAY') and config.RATE_LIMIT_DELAY > 0